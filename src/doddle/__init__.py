@@ -1,3 +1,18 @@
-from .facade import Doddle
+from __future__ import annotations
+
+import typing
+
+if typing.TYPE_CHECKING:
+    from .facade import Doddle  # pragma: no cover
 
 __all__ = ["Doddle"]
+
+
+def __getattr__(name: str) -> typing.Any:
+    # The facade pulls in every solver, so it is only imported once it is first used.
+    if name == "Doddle":
+        from .facade import Doddle
+
+        return Doddle
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
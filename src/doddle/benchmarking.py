@@ -1,30 +1,248 @@
 from __future__ import annotations
 
-import random
+import multiprocessing
+import os
+import sys
 import typing
 from collections import defaultdict
-from concurrent.futures import ProcessPoolExecutor
-from dataclasses import dataclass
-from functools import partial
-from itertools import groupby
-from math import sqrt
-from typing import Callable, Iterable, Protocol, TypeVar
-
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, replace
+from functools import cached_property, partial
+from itertools import islice
+from math import ceil, sqrt
+from multiprocessing.context import BaseContext
+from typing import Any, Callable, Iterable, Iterator, Protocol, Sequence, TypeVar
+
+import numpy as np
+from numba import njit  # type: ignore
 from tqdm import tqdm  # type: ignore
 
 from .boards import Scoreboard, ScoreboardPrinter
-from .engine import Engine, SimulEngine
+from .engine import MAX_ITERS, Engine, SimulEngine
 from .exceptions import InvalidWordleBotFileError
 from .game import DoddleGame, Game, SimultaneousGame
 from .graph import GraphBuilder
-from .histogram import HistogramBuilder
 from .scoring import Scorer, to_ternary
+from .views import NullRunReporter
 from .words import Word, WordSeries
 
 if typing.TYPE_CHECKING:
     from graphviz import Digraph  # type: ignore # pragma: no cover
 
 TGame = TypeVar("TGame", bound=DoddleGame, covariant=True)
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The number of chunks handed to each worker; enough to balance the load without
+# paying for a round trip to the main process on every handful of games.
+CHUNKS_PER_WORKER = 4
+
+# The number of chunks each worker may have queued at once. A new chunk is submitted
+# as each one completes so that slow chunks never hold up the aggregation of others.
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+# Worker state. Each process in the pool receives the engine exactly once via the
+# initializer so that tasks only need to carry integer indices into common_words.
+_ENGINE: Any = None
+_GUESSES: list[Word] = []
+_OPENING: tuple[Word, dict[int, WordSeries]] | None = None
+
+
+def _init_worker(
+    engine: Engine | SimulEngine,
+    user_guesses: list[Word],
+    opening: tuple[Word, dict[int, WordSeries]] | None = None,
+) -> None:
+    """Stores the engine and opening guesses as globals within a worker process.
+
+    Args:
+        engine (Engine | SimulEngine): The engine used to play each game.
+        user_guesses (list[Word]): The opening guesses.
+        opening (tuple[Word, dict[int, WordSeries]] | None, optional):
+            The opening guess and its histogram, shared by every game. Defaults to None.
+    """
+    global _ENGINE, _GUESSES, _OPENING
+    _ENGINE = engine
+    _GUESSES = user_guesses
+    _OPENING = opening
+
+
+def _run_idx(i: int) -> Game:
+    """Plays a single game whose solution is the i'th common word."""
+    soln = _ENGINE.dictionary.common_words.iloc[i]
+    return _ENGINE.run(soln, user_guesses=_GUESSES, opening=_OPENING)
+
+
+def _run_idx_rounds(i: int) -> int:
+    """Plays a single game whose solution is the i'th common word, returning only its rounds."""
+    soln = _ENGINE.dictionary.common_words.iloc[i]
+    return _ENGINE.run_rounds(soln, user_guesses=_GUESSES, opening=_OPENING)
+
+
+def _run_simul_idxs(idxs: list[int]) -> SimultaneousGame:
+    """Plays a simultaneous game whose solutions are the given common words."""
+    solns = _ENGINE.dictionary.common_words.words[idxs].tolist()
+    return _ENGINE.run(solns, user_guesses=_GUESSES, opening=_OPENING)
+
+
+def _run_chunk(
+    run: Callable[[T], DoddleGame], num_bins: int, tasks: Sequence[T]
+) -> tuple[np.ndarray, list[Scoreboard]]:
+    """Plays a chunk of games within a worker, aggregating the results locally.
+
+    Only the histogram of rounds and the scoreboards are sent back to the main process.
+
+    Args:
+        run (Callable[[T], DoddleGame]): The function that plays a game given a task.
+        num_bins (int): The size of the histogram (i.e. one more than the most rounds possible).
+        tasks (Sequence[T]): The tasks in the chunk.
+
+    Returns:
+        tuple[np.ndarray, list[Scoreboard]]:
+            The number of games indexed by the number of rounds and the scoreboards.
+    """
+    rounds = np.empty(len(tasks), dtype=np.int32)
+    scoreboards: list[Scoreboard] = []
+    for i, task in enumerate(tasks):
+        game = run(task)
+        rounds[i] = game.rounds
+        scoreboards.append(game.scoreboard)
+
+    histogram = np.bincount(rounds, minlength=num_bins)
+    return histogram, scoreboards
+
+
+def _count_rounds(
+    run_rounds: Callable[[T], int], num_bins: int, tasks: Sequence[T]
+) -> tuple[np.ndarray, list[Scoreboard]]:
+    """Plays a chunk of games within a worker, keeping only the number of rounds of each.
+
+    Args:
+        run_rounds (Callable[[T], int]): The function that plays a game given a task.
+        num_bins (int): The size of the histogram (i.e. one more than the most rounds possible).
+        tasks (Sequence[T]): The tasks in the chunk.
+
+    Returns:
+        tuple[np.ndarray, list[Scoreboard]]:
+            The number of games indexed by the number of rounds and no scoreboards.
+    """
+    rounds = np.fromiter(map(run_rounds, tasks), dtype=np.int32, count=len(tasks))
+    return np.bincount(rounds, minlength=num_bins), []
+
+
+def _to_dict(histogram: np.ndarray) -> dict[int, int]:
+    """Converts a dense histogram into a dictionary of its non-zero counts."""
+    return {int(rounds): int(histogram[rounds]) for rounds in np.flatnonzero(histogram)}
+
+
+def _partition(total: int) -> tuple[int, int]:
+    """Determines the number of workers and the chunk size for a benchmark.
+
+    Args:
+        total (int): The number of games to be played.
+
+    Returns:
+        tuple[int, int]: The number of workers and the number of games per chunk.
+    """
+    cpu_count = getattr(os, "process_cpu_count", os.cpu_count)() or 1
+    workers = max(1, min(cpu_count, total))
+    chunk_size = max(1, total // (workers * CHUNKS_PER_WORKER))
+    return workers, chunk_size
+
+
+def _mp_context() -> BaseContext:
+    """Chooses how the benchmark workers are started.
+
+    On Linux the workers are forked, so they inherit the precomputed score matrix and the
+    compiled numba kernels as copy-on-write pages instead of rebuilding them (Python 3.14
+    makes forkserver the default there). Elsewhere, fork is unsafe or unavailable, so the
+    workers come from a forkserver where one exists and are spawned otherwise.
+
+    Returns:
+        BaseContext: The multiprocessing context for the worker pool.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    if sys.platform == "linux" and "fork" in methods:
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _ranges(total: int, size: int) -> Iterator[range]:
+    """Splits range(total) into consecutive ranges of (at most) the given size.
+
+    A range pickles as three integers however many games it spans, so sending one
+    to a worker costs the same for any chunk size.
+    """
+    for start in range(0, total, size):
+        yield range(start, min(start + size, total))
+
+
+def _imap_unordered(
+    executor: Executor, fn: Callable[[T], R], tasks: Iterable[T], max_in_flight: int
+) -> Iterator[tuple[int, R]]:
+    """Yields the result of each task as soon as it completes, along with its position.
+
+    At most max_in_flight tasks are submitted at once, with another submitted as each
+    one finishes.
+
+    Args:
+        executor (Executor): The executor that runs the tasks.
+        fn (Callable[[T], R]): The function applied to each task.
+        tasks (Iterable[T]): The tasks.
+        max_in_flight (int): The maximum number of tasks submitted but not yet yielded.
+
+    Yields:
+        Iterator[tuple[int, R]]: The position of each task and its result, in completion order.
+    """
+    numbered_tasks = enumerate(tasks)
+    pending: dict[Future[R], int] = {}
+    num_to_submit = max_in_flight
+    while True:
+        for i, task in islice(numbered_tasks, num_to_submit):
+            pending[executor.submit(fn, task)] = i
+
+        if not pending:
+            return
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future.result()
+        num_to_submit = len(done)
+
+
+def _play_chunks(
+    executor: Executor,
+    run_chunk: Callable[[Sequence[T]], tuple[np.ndarray, list[Scoreboard]]],
+    chunks: Iterable[Sequence[T]],
+    num_chunks: int,
+    num_bins: int,
+    max_in_flight: int,
+) -> tuple[np.ndarray, list[Scoreboard]]:
+    """Plays every chunk of games, aggregating results in whichever order they complete.
+
+    Args:
+        executor (Executor): The executor that plays the chunks.
+        run_chunk (Callable[[Sequence[T]], tuple[np.ndarray, list[Scoreboard]]]):
+            The function that plays a chunk of games.
+        chunks (Iterable[Sequence[T]]): The chunks.
+        num_chunks (int): The number of chunks.
+        num_bins (int): The size of the histogram.
+        max_in_flight (int): The maximum number of chunks submitted at once.
+
+    Returns:
+        tuple[np.ndarray, list[Scoreboard]]:
+            The number of games indexed by the number of rounds and the scoreboards,
+            in the same order as the chunks.
+    """
+    histogram = np.zeros(num_bins, dtype=np.int64)
+    scoreboards_by_chunk: list[list[Scoreboard]] = [[] for _ in range(num_chunks)]
+    results = _imap_unordered(executor, run_chunk, chunks, max_in_flight)
+    for i, (partial_histogram, partial_scoreboards) in tqdm(results, total=num_chunks):
+        histogram += partial_histogram
+        scoreboards_by_chunk[i] = partial_scoreboards
+
+    scoreboards = [scoreboard for chunk in scoreboards_by_chunk for scoreboard in chunk]
+    return histogram, scoreboards
 
 
 class __Printer(Protocol):
@@ -37,6 +255,7 @@ class Benchmark:
     guesses: list[Word]
     histogram: dict[int, int]
     scoreboards: list[Scoreboard]
+    total_games: int | None = None
 
     @property
     def opening_guess(self) -> Word:
@@ -45,39 +264,59 @@ class Benchmark:
 
         return self.scoreboards[0].rows[0].guess
 
+    @cached_property
+    def _guess_label(self) -> str:
+        """The opening guesses as displayed in the benchmark's summary."""
+        if self.guesses:
+            return ",".join(str(word) for word in self.guesses)
+
+        return str(self.opening_guess)
+
+    @cached_property
+    def _moments(self) -> tuple[int, int, int]:
+        """The number of games, the number of guesses and the sum of squared guesses.
+
+        All summary statistics derive from these three sums, which are accumulated in a
+        single pass over the histogram. The histogram is treated as immutable once the
+        benchmark exists.
+        """
+        s0 = s1 = s2 = 0
+        for k, v in self.histogram.items():
+            s0 += v
+            s1 += k * v
+            s2 += k * k * v
+        return s0, s1, s2
+
     def num_games(self) -> int:
-        return sum(self.histogram.values())
+        if self.total_games is not None:
+            return self.total_games
+
+        return self._moments[0]
 
     def num_guesses(self) -> int:
-        return sum(k * v for k, v in self.histogram.items())
+        return self._moments[1]
 
     def mean(self) -> float:
-        return self.num_guesses() / self.num_games()
+        n, num_guesses, _ = self._moments
+        return num_guesses / n
 
     def std(self) -> float:
 
-        n = self.num_games()
-        mean = self.mean()
+        n, num_guesses, sum_of_squares = self._moments
+        mean = num_guesses / n
 
-        mean_x_squared = sum(k * k * v for k, v in self.histogram.items()) / n
+        mean_x_squared = sum_of_squares / n
         variance = mean_x_squared - (mean * mean)
 
         return sqrt(variance)
 
     def to_csv(self, path: str) -> None:
-        def solution(scoreboard: Scoreboard) -> str:
-            return scoreboard.rows[0].soln.value
-
-        ordered_scoreboards = sorted(self.scoreboards, key=solution)
-
-        lines: list[str] = []
-        for scoreboard in ordered_scoreboards:
-            line = ",".join(str(row.guess) for row in scoreboard.rows)
-            lines.append(line)
+        # Sort positions by a precomputed key to avoid resolving each solution per comparison
+        solutions = [scoreboard.rows[0].soln.value for scoreboard in self.scoreboards]
+        order = sorted(range(len(solutions)), key=solutions.__getitem__)
 
-        contents = "\n".join(lines)
-
-        self._write_to_file(path, contents)
+        lines = (",".join(str(row.guess) for row in self.scoreboards[i].rows) for i in order)
+        self._write_to_file(path, lines)
 
     def digraph(self, *, predicate: Callable[[Scoreboard], bool] | None = None) -> "Digraph":
 
@@ -101,9 +340,12 @@ class Benchmark:
         p.text(text_display)
 
     @staticmethod
-    def _write_to_file(path: str, content: str) -> None:  # pragma: no cover
-        with open(path, "w") as f:
-            f.write(content)
+    def _write_to_file(path: str, lines: Iterable[str]) -> None:  # pragma: no cover
+        with open(path, "w", buffering=1 << 20) as f:
+            for i, line in enumerate(lines):
+                if i:
+                    f.write("\n")
+                f.write(line)
 
     @classmethod
     def read_csv(cls, path: str, validate: bool = True) -> Benchmark:
@@ -115,29 +357,38 @@ class Benchmark:
 
     @classmethod
     def from_csv(cls, raw_content: str, validate: bool = True) -> Benchmark:
-        all_lines = [[Word(word) for word in line.split(",")] for line in raw_content.split("\n")]
-        potential_solns = WordSeries([str(line[-1]) for line in all_lines])
+        rows = [line.split(",") for line in raw_content.splitlines()]
+        # Bot files repeat the same few guesses on every line, so build each Word once.
+        words = {value: Word(value) for value in {value for row in rows for value in row}}
+        all_lines = [[words[value] for value in row] for row in rows]
+        potential_solns = WordSeries([row[-1] for row in rows])
         size = len(all_lines[0][0])
         scorer = Scorer(size)
-        histogram_builder = HistogramBuilder(scorer, potential_solns, potential_solns)
 
+        # Bot files reuse a handful of guesses across every line, so each distinct guess
+        # is scored against all of the potential solutions exactly once up front.
+        guess_idx_by_word: dict[Word, int] = {}
+        for guesses in all_lines:
+            for guess in guesses:
+                guess_idx_by_word.setdefault(guess, len(guess_idx_by_word))
+        score_matrix = scorer.score_all(list(guess_idx_by_word), potential_solns.words)
+
+        soln_idx_by_word = {soln: i for i, soln in enumerate(potential_solns)}
         scoreboards: list[Scoreboard] = []
-        histogram: defaultdict[int, int] = defaultdict(int)
         for guesses in all_lines:
-            n = len(guesses)
-            histogram[n] += 1
             soln = guesses[-1]
+            soln_idx = soln_idx_by_word[soln]
+            guess_idxs = np.array([guess_idx_by_word[guess] for guess in guesses], dtype=np.int64)
+            scores, nums_left = _replay(soln_idx, guess_idxs, score_matrix)
+
             scoreboard = Scoreboard()
-            solns = potential_solns
             for i, guess in enumerate(guesses):
-                score = scorer.score_word(soln, guess)
-                solns_by_score = histogram_builder.get_solns_by_score(solns, guess)
-                solns = solns_by_score[score]
-                ternary = to_ternary(score, size)
-                scoreboard.add_row(i + 1, soln, guess, ternary, len(solns))
+                ternary = to_ternary(scores[i], size)
+                scoreboard.add_row(i + 1, soln, guess, ternary, int(nums_left[i]))
 
             scoreboards.append(scoreboard)
 
+        histogram = _to_dict(np.bincount([len(guesses) for guesses in all_lines]))
         user_guesses: list[Word] = []
         benchmark = cls(user_guesses, histogram, scoreboards)
 
@@ -149,28 +400,25 @@ class Benchmark:
     def validate(self) -> None:
 
         size = len(self.scoreboards[0].rows[0].score)
-
-        def create_key(n: int):
-            def score_path(scoreboard: Scoreboard) -> str:
-                scores: list[str] = []
-                for i in range(min(n, len(scoreboard.rows))):
-                    score = scoreboard.rows[i].score
-                    scores.append(score)
-                return "-".join(scores)
-
-            return score_path
-
-        worst_num_rounds = max(scoreboard.rows[-1].n for scoreboard in self.scoreboards)
-        sorted_boards = sorted(self.scoreboards, key=create_key(worst_num_rounds))
-
-        for i in range(1, worst_num_rounds + 1):
-            selector = create_key(i)
-            grps = groupby(sorted_boards, key=selector)
-            for _, grp in grps:
-                inner_scoreboards = list(grp)
-                if len(inner_scoreboards) == 1:
+        worst_num_rounds = max(self.histogram)
+
+        # Scoreboards are bucketed by the path of scores observed so far. At each round,
+        # every bucket is split by the next score so that the scoreboards in a bucket have
+        # all observed identical patterns. A consistent solver must then play the same
+        # follow-up guess for every scoreboard in the bucket.
+        buckets: dict[tuple[str, ...], list[Scoreboard]] = {(): self.scoreboards}
+        for i in range(1, worst_num_rounds):
+            new_buckets: defaultdict[tuple[str, ...], list[Scoreboard]] = defaultdict(list)
+            for path, scoreboards in buckets.items():
+                if len(scoreboards) == 1:
                     continue
-                first_scoreboard = next(sb for sb in inner_scoreboards if len(sb) > i)
+                for scoreboard in scoreboards:
+                    if len(scoreboard) > i:
+                        new_path = path + (scoreboard.rows[i - 1].score,)
+                        new_buckets[new_path].append(scoreboard)
+
+            for inner_scoreboards in new_buckets.values():
+                first_scoreboard = inner_scoreboards[0]
                 first_follow_up_guess = first_scoreboard.rows[i].guess
                 for scoreboard in inner_scoreboards:
                     follow_up_guess = scoreboard.rows[i].guess
@@ -189,34 +437,101 @@ class Benchmark:
                         )
                         raise InvalidWordleBotFileError(message)
 
+            buckets = new_buckets
+
+
+@njit(cache=True)
+def _replay(
+    soln_idx: int, guess_idxs: np.ndarray, score_matrix: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Replays a sequence of guesses against a known solution.
+
+    Each guess is scored against the solution and the remaining potential solutions
+    are whittled down to those consistent with the observed score.
+
+    Args:
+        soln_idx (int): The index of the solution amongst the potential solutions.
+        guess_idxs (np.ndarray): The index of each guess into the rows of the score matrix.
+        score_matrix (np.ndarray): The score of every guess against every potential solution.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            The score of each guess and the number of solutions left after each guess.
+    """
+    num_guesses = guess_idxs.shape[0]
+    num_solns = score_matrix.shape[1]
+    scores = np.empty(num_guesses, dtype=np.int32)
+    nums_left = np.empty(num_guesses, dtype=np.int32)
+    is_remaining = np.ones(num_solns, dtype=np.bool_)
+
+    for i in range(num_guesses):
+        guess_scores = score_matrix[guess_idxs[i]]
+        score = guess_scores[soln_idx]
+        num_left = 0
+        for j in range(num_solns):
+            if not is_remaining[j]:
+                continue
+            if guess_scores[j] == score:
+                num_left += 1
+            else:
+                is_remaining[j] = False
+        scores[i] = score
+        nums_left[i] = num_left
+
+    return scores, nums_left
+
 
 @dataclass
 class Benchmarker:
     """A class to benchmark the performance of a Doddle engine"""
 
+    __slots__ = ["engine", "reporter"]
+
     engine: Engine
     reporter: BenchmarkReporter
 
-    def run_benchmark(self, user_guesses: list[Word]) -> Benchmark:
+    def run_benchmark(self, user_guesses: list[Word], collect_games: bool = True) -> Benchmark:
         """Benchmarks an engine given a list of user-supplied, opening guesses.
 
         Args:
             user_guesses (list[Word]): The opening guesses.
+            collect_games (bool, optional): Whether to keep the scoreboard of every game.
+              When False, workers play each game without recording it and only report
+              the number of rounds taken. Defaults to True.
         """
         dictionary = self.engine.dictionary
-        f = partial(self.engine.run, user_guesses=user_guesses)
 
         total = len(dictionary.common_words)
-        histogram: defaultdict[int, int] = defaultdict(int)
-        solved_games: list[Game] = []
-        with ProcessPoolExecutor() as executor:
-            games = executor.map(f, dictionary.common_words, chunksize=20)
-            for game in tqdm(games, total=total):
-                solved_games.append(game)
-                histogram[game.rounds] += 1
-
-        scoreboards = [game.scoreboard for game in solved_games]
-        benchmark = Benchmark(user_guesses, histogram, scoreboards)
+        num_bins = MAX_ITERS + 1
+        workers, chunk_size = _partition(total)
+
+        # The opening guess and its histogram are the same for every game, so they are
+        # computed once here rather than once per game in the workers.
+        opening = self.engine.opening(user_guesses)
+
+        # Nobody watches the games played in the workers, so they never report progress.
+        initargs = (replace(self.engine, reporter=NullRunReporter()), user_guesses, opening)
+        with ProcessPoolExecutor(
+            workers, mp_context=_mp_context(), initializer=_init_worker, initargs=initargs
+        ) as executor:
+            chunks = _ranges(total, chunk_size)
+            if collect_games:
+                run_chunk = partial(_run_chunk, _run_idx, num_bins)
+            else:
+                run_chunk = partial(_count_rounds, _run_idx_rounds, num_bins)
+            num_chunks = ceil(total / chunk_size)
+            max_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+            histogram, scoreboards = _play_chunks(
+                executor, run_chunk, chunks, num_chunks, num_bins, max_in_flight
+            )
+
+        guesses = user_guesses
+        if not (guesses or scoreboards):
+            # Without any scoreboards, the opening guess can only come from the solver.
+            opening_guess, _ = opening
+            guesses = [opening_guess]
+
+        benchmark = Benchmark(guesses, _to_dict(histogram), scoreboards, total_games=total)
         self.reporter.display(benchmark)
         return benchmark
 
@@ -225,6 +540,8 @@ class Benchmarker:
 class SimulBenchmarker:
     """A class to benchmark the performance of a Doddle SimulEngine"""
 
+    __slots__ = ["engine", "reporter"]
+
     engine: SimulEngine
     reporter: BenchmarkReporter
 
@@ -238,33 +555,33 @@ class SimulBenchmarker:
             num_simul (int): The number of games to be played simultaneously.
             num_runs (int, optional): The number of runs in the benchmark. Defaults to 100.
         """
-        random.seed(13)
-
         dictionary = self.engine.dictionary
-        f = partial(self.engine.run, user_guesses=user_guesses)
+        num_bins = MAX_ITERS + num_simul + 1
+        workers, chunk_size = _partition(num_runs)
 
-        def generate_games() -> Iterable[list[Word]]:
+        def generate_chunks() -> Iterator[list[list[int]]]:
+            # Draw each chunk's solution indices in one call as it is dispatched, using a
+            # seeded generator of its own rather than reseeding the global RNG.
+            rng = np.random.default_rng(13)
             dict_size = len(dictionary.common_words)
-            for _ in range(num_runs):
-                solns: list[Word] = []
-                for _ in range(num_simul):
-                    idx = random.randrange(dict_size)
-                    soln = dictionary.common_words.iloc[idx]
-                    solns.append(soln)
-                yield solns
-
-        game_factory = generate_games()
-
-        solved_games: list[SimultaneousGame] = []
-        histogram: defaultdict[int, int] = defaultdict(int)
-        with ProcessPoolExecutor() as executor:
-            games = executor.map(f, game_factory, chunksize=20)
-            for game in tqdm(games, total=num_runs):
-                solved_games.append(game)
-                histogram[game.rounds] += 1
-
-        scoreboards = [game.scoreboard for game in solved_games]
-        benchmark = Benchmark(user_guesses, histogram, scoreboards)
+            for start in range(0, num_runs, chunk_size):
+                num_games = min(chunk_size, num_runs - start)
+                yield rng.integers(0, dict_size, size=(num_games, num_simul)).tolist()
+
+        opening = self.engine.opening(user_guesses)
+        initargs = (replace(self.engine, reporter=NullRunReporter()), user_guesses, opening)
+        with ProcessPoolExecutor(
+            workers, mp_context=_mp_context(), initializer=_init_worker, initargs=initargs
+        ) as executor:
+            chunks = generate_chunks()
+            run_chunk = partial(_run_chunk, _run_simul_idxs, num_bins)
+            num_chunks = ceil(num_runs / chunk_size)
+            max_in_flight = workers * CHUNKS_IN_FLIGHT_PER_WORKER
+            histogram, scoreboards = _play_chunks(
+                executor, run_chunk, chunks, num_chunks, num_bins, max_in_flight
+            )
+
+        benchmark = Benchmark(user_guesses, _to_dict(histogram), scoreboards, total_games=num_runs)
         self.reporter.display(benchmark)
         return benchmark
 
@@ -278,13 +595,8 @@ class BenchmarkPrinter:
     @staticmethod
     def describe(benchmark: Benchmark) -> str:
 
-        if benchmark.guesses:
-            guess = ",".join(str(word) for word in benchmark.guesses)
-        else:
-            guess = str(benchmark.opening_guess)
-
         stats = f"""
-Guess:    {guess}
+Guess:    {benchmark._guess_label}
 Games:    {benchmark.num_games():,}
 Guesses:  {benchmark.num_guesses():,}
 Mean:     {benchmark.mean():.3f}
@@ -302,20 +614,18 @@ Std:      {benchmark.std():.3f}
         largest = max(histogram.values())
         increment = largest / CHARS
 
-        stars: list[str] = []
-        for i in range(worst_score):
-            value = histogram.get(i + 1, 0)
-            num = round(value / increment)
-            stars.append("*" * num)
+        counts = [histogram.get(i + 1, 0) for i in range(worst_score)]
+        nums = [round(count / increment) for count in counts]
+        max_stars = max(nums)
 
-        max_stars = max(len(star) for star in stars)
+        # Every bar is a window onto the same run of stars followed by padding.
+        bars = "*" * max_stars + " " * max_stars
 
         rows: list[str] = []
-        for i, star in enumerate(stars):
-            value = histogram.get(i + 1, 0)
-            counts = f"({value:,})".rjust(9, " ")
-            padded_star = star.ljust(max_stars, " ")
-            row = f"{i+1} | {padded_star}{counts}"
+        for i, (count, num) in enumerate(zip(counts, nums)):
+            bracketed_count = f"({count:,})".rjust(9, " ")
+            bar = bars[max_stars - num : 2 * max_stars - num]
+            row = f"{i+1} | {bar}{bracketed_count}"
             rows.append(row)
 
         return "\n".join(rows)
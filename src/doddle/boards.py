@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import re
+import sys
 from dataclasses import dataclass
-from itertools import zip_longest
+from functools import lru_cache
 from typing import Any, Iterator
 
 import colorama
@@ -10,13 +11,131 @@ from colorama import Fore
 
 from .words import Word
 
-colorama.init()
+
+@lru_cache(maxsize=None)
+def _use_colors() -> bool:
+    """Decides, once, whether printed boards are coloured.
+
+    Colours are only emitted when stdout is a terminal, in which case colorama is
+    initialised so that they also render on Windows. Redirected or captured output is
+    left as plain text.
+
+    Returns:
+        bool: Whether printed boards are coloured.
+    """
+    if not sys.stdout.isatty():
+        return False
+    colorama.init()
+    return True
+
+
+_COLOR_BY_DIGIT = {"0": Fore.RESET, "1": Fore.YELLOW, "2": Fore.GREEN}
+_SCORE_RUNS = re.compile("0+|1+|2+")
+
+_EMOJI_TABLE = str.maketrans({"0": "⬜", "1": "🟨", "2": "🟩"})
+
+_KEYPAD = "\ufe0f\u20e3"
+_NUM_KEYPADS = [str(i) + _KEYPAD for i in range(10)] + ["🔟"]
+_CLOCK_KEYPADS = list("🕚🕛🕐🕑🕒🕓🕔🕕🕖🕗🕘🕙")
+_EMOJI_BY_NUM = {i: e for i, e in enumerate(_NUM_KEYPADS + _CLOCK_KEYPADS)}
+
+_HTML_ROW = """
+            <tr>
+                <th>{n}</th>
+                <td><tt>{soln}</tt></td>
+                <td><tt>{guess}</tt></td>
+                <td>{score}</td>
+                <td>{num_left}</td>
+            </tr>"""
+
+_HTML_DIVIDER = """
+                <tr>
+                    <td colspan="5" class="divider"><hr /></td>
+                </tr>"""
+
+_HTML_TABLE = """
+        <table>
+        <thead>
+          <tr>
+            <th></th>
+            <th>Soln</th>
+            <th>Guess</th>
+            <th>Score</th>
+            <th>Poss</th>
+          </tr>
+        </thead>
+        <tbody>{rows}
+        </tbody>
+        </table>
+        """
+
+_UNSET = -1
+_DIGIT_BY_CHAR = {"0": 0, "1": 1, "2": 2}
+_KB_BOARD = """
+    Q  W  E  R  T  Y  U  I  O  P
+     A  S  D  F  G  H  J  K  L
+      Z  X  C  V  B  N  M
+      """
+_KB_COLOR_BY_DIGIT = {_UNSET: Fore.RESET, 0: Fore.LIGHTBLACK_EX, 1: Fore.YELLOW, 2: Fore.GREEN}
+
+# Each key paired with the whitespace preceding it, plus the whitespace after the last key.
+_KB_KEYS: list[tuple[str, str]] = re.findall("([^A-Z]*)([A-Z])", _KB_BOARD)
+_KB_TAIL = _KB_BOARD[_KB_BOARD.rindex("M") + 1 :]
+
+
+@lru_cache(maxsize=None)
+def _build_header(size: int) -> str:
+    repetitions = 0 if size <= 5 else (size - 5)
+    spacing = " " * repetitions
+    header = f"\n| # | Soln.{spacing} | Guess{spacing} | Score{spacing} | Poss.{spacing} |\n"
+    header += _build_divider(size)
+    return header
+
+
+@lru_cache(maxsize=None)
+def _build_divider(size: int) -> str:
+    repetitions = 0 if size <= 5 else (size - 5)
+    dashes = "-" * repetitions
+    return f"|---|-------{dashes}|-------{dashes}|-------{dashes}|-------{dashes}|"
+
+
+@lru_cache(maxsize=1024)
+def _score_segments(score: str) -> tuple[tuple[tuple[int, int, str], ...], str]:
+    """Splits a ternary score into runs of identical digits.
+
+    Colours are only emitted when the digit changes, so a word is coloured by copying
+    it over one slice per run. There are only a few hundred distinct scores in a game.
+
+    Args:
+        score (str): The ternary score e.g. 10020
+
+    Returns:
+        tuple[tuple[tuple[int, int, str], ...], str]:
+            The start, end and colour prefix of each run, and the suffix of the string.
+    """
+    segments: list[tuple[int, int, str]] = []
+    for run in _SCORE_RUNS.finditer(score):
+        start, end = run.span()
+        digit = score[start]
+        prefix = _COLOR_BY_DIGIT[digit] if start or digit != "0" else ""
+        segments.append((start, end, prefix))
+
+    suffix = Fore.RESET if score and score[-1] != "0" else ""
+    return tuple(segments), suffix
+
+
+@lru_cache(maxsize=None)
+def _dead_row(size: int) -> str:
+    """The emoji row used to pad a board that was solved in fewer rounds."""
+    return "⬛" * size
 
 
 @dataclass
 class ScoreboardRow:
     """A dataclass representing an individual row in a scoreboard."""
 
+    __slots__ = ["n", "soln", "guess", "score", "num_left"]
+
     n: int
     soln: Word
     guess: Word
@@ -25,9 +144,8 @@ class ScoreboardRow:
 
     def __repr__(self) -> str:
         """String representation of a row"""
-        a = f"n={self.n}, soln={self.soln}, guess={self.guess}, "
-        b = f"score={self.score}, num_left={self.num_left}"
-        return a + b
+        values = (self.n, self.soln, self.guess, self.score, self.num_left)
+        return "n=%d, soln=%s, guess=%s, score=%s, num_left=%d" % values
 
     def emoji(self) -> str:
         """Returns the ⬜/🟨/🟩 emojis for a given row
@@ -35,11 +153,7 @@ class ScoreboardRow:
         Returns:
           str: The emoji representation of a row.
         """
-        score = self.score
-        score = score.replace("0", "⬜")
-        score = score.replace("1", "🟨")
-        score = score.replace("2", "🟩")
-        return score
+        return self.score.translate(_EMOJI_TABLE)
 
     def to_dict(self, use_emojis: bool = True) -> dict[str, Any]:
         """
@@ -132,9 +246,17 @@ class Scoreboard:
 
         answer = soln if soln else Word("?" * len(guess))
         row = ScoreboardRow(n, answer, guess, score, num_left)
-        self.rows.append(row)
+        self.append(row)
         return row
 
+    def append(self, row: ScoreboardRow) -> None:
+        """Appends an existing row to the scoreboard.
+
+        Args:
+            row (ScoreboardRow): The row.
+        """
+        self.rows.append(row)
+
     def emoji(self) -> str:
         """Creates a beautiful emoji representation of the game.
         If a simultaneous game is played, the emojis will include
@@ -155,11 +277,17 @@ class Scoreboard:
         Returns:
             list[Scoreboard]: A list of scoreboards.
         """
-        scoreboard_by_soln: defaultdict[Word, Scoreboard] = defaultdict(Scoreboard)
-        for row in self:
-            scoreboard_by_soln[row.soln].rows.append(row)
+        rows_by_soln: dict[Word, list[ScoreboardRow]] = {}
+        for row in self.rows:
+            rows_by_soln.setdefault(row.soln, []).append(row)
+
+        scoreboards: list[Scoreboard] = []
+        for rows in rows_by_soln.values():
+            scoreboard = Scoreboard()
+            scoreboard.rows = rows
+            scoreboards.append(scoreboard)
 
-        return list(scoreboard_by_soln.values())
+        return scoreboards
 
 
 class ScoreboardPrinter:
@@ -175,15 +303,30 @@ class ScoreboardPrinter:
         if len(scoreboard) == 0:
             return
 
-        if scoreboard.rows[-1].n == 1:
+        # Rows are appended round by round so the first round sits at the start. Only
+        # whether there is more than one first-round row matters, so the scan stops early.
+        num_first_rows = 0
+        for row in scoreboard.rows:
+            if row.n != 1 or num_first_rows > 1:
+                break
+            num_first_rows += 1
+
+        last_round = scoreboard.rows[-1].n
+        if last_round == 1:
             header = self.build_header()
             print(header)
-        elif len([row.n for row in scoreboard.rows if row.n == 1]) > 1:
+        elif num_first_rows > 1:
             divider = self.build_divider()
             print(divider)
 
-        last_round = scoreboard.rows[-1].n
-        last_rows = [row for row in scoreboard.rows if row.n == last_round]
+        # Rows are appended round by round so the last round sits at the end.
+        last_rows: list[ScoreboardRow] = []
+        for row in reversed(scoreboard.rows):
+            if row.n != last_round:
+                break
+            last_rows.append(row)
+        last_rows.reverse()
+
         for row in last_rows:
             row_str_repr = self.build_row(row.n, row.soln, row.guess, row.score, row.num_left)
             print(row_str_repr)
@@ -201,50 +344,48 @@ class ScoreboardPrinter:
         return "\n".join(scoreboard_str_repr)
 
     def build_header(self) -> str:
-        repetitions = 0 if self.size <= 5 else (self.size - 5)
-        spacing = " " * repetitions
-        header = f"\n| # | Soln.{spacing} | Guess{spacing} | Score{spacing} | Poss.{spacing} |\n"
-        header += self.build_divider()
-        return header
+        return _build_header(self.size)
 
     def build_divider(self) -> str:
-        repetitions = 0 if self.size <= 5 else (self.size - 5)
-        dashes = "-" * repetitions
-        return f"|---|-------{dashes}|-------{dashes}|-------{dashes}|-------{dashes}|"
+        return _build_divider(self.size)
 
     def build_row(self, n: int, soln: Word, guess: Word, score: str, num_left: int) -> str:
 
         n2 = str(n).rjust(2, " ")
 
+        # Words are converted to plain strings once rather than on every comparison,
+        # concatenation and iteration below.
+        soln_str = str(soln)
+        guess_str = str(guess)
+
         padding = " " * max(0, 5 - self.size)
-        num_left_str = " " if guess == soln else f"{num_left}"
+        num_left_str = " " if guess_str == soln_str else f"{num_left}"
         padded_num_left = num_left_str.rjust(max(5, self.size), " ")
 
-        pretty_soln = soln + padding
-        pretty_guess = self._color_code(guess, score) + padding
-        pretty_score = self._color_code(score, score) + padding
+        pretty_soln = soln_str + padding
+        if _use_colors():
+            pretty_guess = self._color_code(guess_str, score) + padding
+            pretty_score = self._color_code(score, score) + padding
+        else:
+            pretty_guess = guess_str + padding
+            pretty_score = score + padding
 
         return f"|{n2} | {pretty_soln} | {pretty_guess} | {pretty_score} | {padded_num_left} |"
 
     @staticmethod
     def _color_code(word: Word | str, score: str) -> str:
-
-        prev_digit = "0"
-        pretty_chars = []
-        for (char, digit) in zip(word, score):
-            if digit == prev_digit:
-                pretty_chars.append(char)
-            elif digit == "2":
-                pretty_chars.append(Fore.GREEN + char)
-            elif digit == "1":
-                pretty_chars.append(Fore.YELLOW + char)
-            else:
-                pretty_chars.append(Fore.RESET + char)
-            prev_digit = digit
-
-        if prev_digit != "0":
-            pretty_chars.append(Fore.RESET)
-
+        chars = str(word)
+
+        # Uniform scores need at most one colour so skip the segment lookup entirely.
+        size = len(score)
+        if score.count("0") == size:
+            return chars[:size]
+        if score.count("2") == size:
+            return Fore.GREEN + chars[:size] + Fore.RESET
+
+        segments, suffix = _score_segments(score)
+        pretty_chars = [prefix + chars[start:end] for start, end, prefix in segments]
+        pretty_chars.append(suffix)
         return "".join(pretty_chars)
 
 
@@ -254,54 +395,31 @@ class HtmlScoreboardPrinter:
         print(string_repr)
 
     def build_string(self, scoreboard: Scoreboard) -> str:
-        row_strings: list[str] = []
-        has_dividers = len(scoreboard.many()) > 1
+        has_dividers = len({row.soln for row in scoreboard.rows}) > 1
+
+        # Each row contributes at most a divider and itself, so the list is sized up
+        # front. Any slots left over are empty strings and vanish when joined.
+        row_strings = [""] * (2 * len(scoreboard.rows))
+        k = 0
 
         prev_row = 1
         for row in scoreboard.rows:
-            n = row.n
             soln = row.soln
             guess = row.guess
-            score = row.emoji()
-            num_left = row.num_left
-
-            num_left_str = str(num_left) if soln != guess else ""
+            num_left_str = str(row.num_left) if soln != guess else ""
 
             if has_dividers and row.n != prev_row:
-                row_divider = """
-                <tr>
-                    <td colspan="5" class="divider"><hr /></td>
-                </tr>"""
-                row_strings.append(row_divider)
+                row_strings[k] = _HTML_DIVIDER
+                k += 1
 
-            row_template = f"""
-            <tr>
-                <th>{n}</th>
-                <td><tt>{soln}</tt></td>
-                <td><tt>{guess}</tt></td>
-                <td>{score}</td>
-                <td>{num_left_str}</td>
-            </tr>"""
-            row_strings.append(row_template)
+            row_strings[k] = _HTML_ROW.format(
+                n=row.n, soln=soln, guess=guess, score=row.emoji(), num_left=num_left_str
+            )
+            k += 1
             prev_row = row.n
 
         all_rows = "".join(row_strings)
-
-        return f"""
-        <table>
-        <thead>
-          <tr>
-            <th></th>
-            <th>Soln</th>
-            <th>Guess</th>
-            <th>Score</th>
-            <th>Poss</th>
-          </tr>
-        </thead>
-        <tbody>{all_rows}
-        </tbody>
-        </table>
-        """
+        return _HTML_TABLE.format(rows=all_rows)
 
 
 class EmojiScoreboardPrinter:
@@ -348,32 +466,29 @@ class EmojiScoreboardPrinter:
 
         clocks = "".join(icons)
 
-        dead_row = "⬛" * size
+        dead_row = _dead_row(size)
+        board_emojis = [[row.emoji() for row in board.rows] for board in scoreboards]
         emoji_lines: list[str] = []
         for i in range(0, num_boards, boards_per_line):
             emoji_lines.append("")
-            boards = scoreboards[i : i + boards_per_line]
+            boards = board_emojis[i : i + boards_per_line]
 
-            for row_tuple in zip_longest(*boards):
-                combined = " ".join([row.emoji() if row else dead_row for row in row_tuple])
-                emoji_lines.append(combined)
+            # Boards solved early are padded with dead rows so that the columns line up.
+            num_rows = max(map(len, boards))
+            padded = [emojis + [dead_row] * (num_rows - len(emojis)) for emojis in boards]
+            emoji_lines.extend(map(" ".join, zip(*padded)))
 
         return header + clocks + "\n" + "\n".join(emoji_lines)
 
     def _get_score_emojjis(self) -> dict[int, str]:
-        keypad = "\ufe0f\u20e3"
-        num_keypads = [str(i) + keypad for i in range(10)] + ["🔟"]
-        clock_keypads = list("🕚🕛🕐🕑🕒🕓🕔🕕🕖🕗🕘🕙")
-        all_keypads = num_keypads + clock_keypads
-        emoji_by_num = {i: e for i, e in enumerate(all_keypads)}
-        return emoji_by_num
+        return _EMOJI_BY_NUM
 
 
 class Keyboard:
     def __init__(self) -> None:
         """Initialises a new instance of a Keyboard object"""
 
-        self.digit_by_char: defaultdict[str, int] = defaultdict(lambda: -1)
+        self.digit_by_char: dict[str, int] = {}
 
     def update(self, word: Word | str, score: str) -> None:
         """Updates the internal state of a keyboard given a scored word
@@ -383,10 +498,12 @@ class Keyboard:
             score (str): The ternary representation of the score
         """
 
+        digit_by_char = self.digit_by_char
+        get_digit = digit_by_char.get
         for (char, digit_str) in zip(word, score):
-            digit = int(digit_str)
-            current_digit = self.digit_by_char[char]
-            self.digit_by_char[char] = max(current_digit, digit)
+            digit = _DIGIT_BY_CHAR[digit_str]
+            if digit > get_digit(char, _UNSET):
+                digit_by_char[char] = digit
 
 
 class KeyboardPrinter:
@@ -401,7 +518,8 @@ class KeyboardPrinter:
 
     @staticmethod
     def build_string(keyboard: Keyboard) -> str:
-        """Builds a coloured string representation of a keyboard
+        """Builds a coloured string representation of a keyboard. The keyboard is
+        left uncoloured when stdout is not a terminal.
 
         Args:
             keyboard (Keyboard): The keyboard
@@ -410,36 +528,21 @@ class KeyboardPrinter:
             str: Returns a coloured string representation of a keyboard
         """
 
-        UNSET = -1
-        BOARD = """
-    Q  W  E  R  T  Y  U  I  O  P
-     A  S  D  F  G  H  J  K  L
-      Z  X  C  V  B  N  M
-      """
+        if not _use_colors():
+            return _KB_BOARD
 
-        prev_digit = UNSET
+        prev_digit = _UNSET
         pretty_chars = []
-        for char in BOARD:
-            if not char.isalpha():
-                pretty_chars.append(char)
-                continue
-
-            digit = keyboard.digit_by_char[char]
-
-            # TODO duplicate logic with other class
-            if digit == prev_digit:
-                pretty_chars.append(char)
-            elif digit == 2:
-                pretty_chars.append(Fore.GREEN + char)
-            elif digit == 1:
-                pretty_chars.append(Fore.YELLOW + char)
-            elif digit == 0:
-                pretty_chars.append(Fore.LIGHTBLACK_EX + char)
-            else:
-                pretty_chars.append(Fore.RESET + char)
+        for gap, char in _KB_KEYS:
+            pretty_chars.append(gap)
+            digit = keyboard.digit_by_char.get(char, _UNSET)
+            if digit != prev_digit:
+                pretty_chars.append(_KB_COLOR_BY_DIGIT[digit])
+            pretty_chars.append(char)
             prev_digit = digit
 
-        if prev_digit != UNSET:
+        pretty_chars.append(_KB_TAIL)
+        if prev_digit != _UNSET:
             pretty_chars.append(Fore.RESET)
 
         return "".join(pretty_chars)
@@ -2,20 +2,17 @@ import sys
 from argparse import ArgumentParser, Namespace
 from typing import Sequence
 
-from .controllers import HideController, SolveController
 from .enums import SolverType
-from .factory import (
-    create_benchmarker,
-    create_engine,
-    create_models,
-    create_simul_benchmarker,
-    create_simul_engine,
-)
-from .views import HideView, SolveView
 from .words import Word
 
+# The solvers and their dependencies (notably the jitted scoring kernels) are slow to
+# import, so each command imports only what it needs once the arguments are parsed.
+
 
 def solve(args: Namespace) -> None:
+    from .controllers import SolveController
+    from .factory import create_models
+    from .views import SolveView
 
     guess: Word | None = args.guess
     depth: int = args.depth
@@ -33,6 +30,9 @@ def solve(args: Namespace) -> None:
 
 
 def hide(args: Namespace) -> None:
+    from .controllers import HideController
+    from .factory import create_models
+    from .views import HideView
 
     guess: Word | None = args.guess
     size: int = len(guess) if guess else args.size
@@ -46,6 +46,7 @@ def hide(args: Namespace) -> None:
 
 
 def run(args: Namespace) -> None:
+    from .factory import create_engine, create_simul_engine
 
     solution: Word = args.answer
     guess: Word | None = args.guess
@@ -66,6 +67,7 @@ def run(args: Namespace) -> None:
 
 
 def benchmark_performance(args: Namespace) -> None:
+    from .factory import create_benchmarker, create_simul_benchmarker
 
     guess: Word | None = args.guess
     depth: int = args.depth
@@ -76,7 +78,7 @@ def benchmark_performance(args: Namespace) -> None:
 
     if simul == 1:
         benchmarker = create_benchmarker(size, solver_type=solver_type, depth=depth, extras=guesses)
-        benchmarker.run_benchmark(guesses)
+        benchmarker.run_benchmark(guesses, collect_games=False)
     else:
         simul_benchmarker = create_simul_benchmarker(
             size, solver_type=solver_type, depth=depth, extras=guesses
@@ -89,6 +91,11 @@ def main() -> None:
 
 
 def parse_args(args: Sequence[str]) -> None:
+    namespace = _PARSER.parse_args(args)
+    namespace.func(namespace)
+
+
+def _build_parser() -> ArgumentParser:
 
     parser = ArgumentParser()
     subparsers = parser.add_subparsers()
@@ -123,5 +130,7 @@ def parse_args(args: Sequence[str]) -> None:
     benchmark_parser.add_argument("--simul", required=False, default=1, type=int)
     benchmark_parser.set_defaults(func=benchmark_performance)
 
-    namespace = parser.parse_args(args)
-    namespace.func(namespace)
+    return parser
+
+
+_PARSER = _build_parser()
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+import numpy as np
+
 from .histogram import HistogramBuilder
 from .scoring import Scorer
 from .solver import Solver
@@ -69,11 +71,12 @@ class HideController:
         for i in range(1, MAX_ITERS):
             histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
 
-            def rank_score(score: int) -> int:
-                solutions = histogram[score]
-                return 0 if guess in solutions else len(solutions)
-
-            highest_score = max(histogram, key=rank_score)
+            # The guess can only ever sit in the perfect-score bucket, so ranking
+            # that bucket as empty stops the solution from ever being revealed.
+            scores = np.fromiter(histogram.keys(), dtype=np.int64, count=len(histogram))
+            sizes = np.fromiter(map(len, histogram.values()), dtype=np.int64, count=len(histogram))
+            sizes[scores == self.scorer.perfect_score] = 0
+            highest_score = int(scores[sizes.argmax()])
             available_answers = histogram[highest_score]
             self.view.update(i, guess, highest_score, available_answers)
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import Iterator
 
 from .exceptions import FailedToFindASolutionError
 from .game import Game, SimultaneousGame
@@ -9,8 +11,11 @@ from .histogram import HistogramBuilder
 from .scoring import Scorer
 from .simul_solver import SimulSolver
 from .solver import Solver
-from .views import RunReporter
-from .words import Dictionary, Word
+from .views import NullRunReporter, RunReporter
+from .words import Dictionary, Word, WordSeries
+
+# The maximum number of guesses in a game (plus one per board in a simultaneous game).
+MAX_ITERS = 20
 
 
 @dataclass
@@ -23,12 +28,36 @@ class Engine:
     solver: Solver[Guess]
     reporter: RunReporter
 
-    def run(self, solution: Word, user_guesses: list[Word]) -> Game:
+    def opening(self, user_guesses: list[Word]) -> tuple[Word, dict[int, WordSeries]]:
+        """Computes the opening guess and the histogram it produces.
+
+        Neither depends on the solution so, when playing many games, they can be computed
+        once and passed to each run.
+
+        Args:
+            user_guesses (list[Word]): A list of user-supplied, opening guesses
+
+        Returns:
+            tuple[Word, dict[int, WordSeries]]:
+                The opening guess and all the solutions, partitioned by its score.
+        """
+        all_words, available_answers = self.dictionary.words
+        guess = user_guesses[0] if user_guesses else self.solver.seed(all_words.word_length)
+        return guess, self.histogram_builder.get_solns_by_score(available_answers, guess)
+
+    def run(
+        self,
+        solution: Word,
+        user_guesses: list[Word],
+        opening: tuple[Word, dict[int, WordSeries]] | None = None,
+    ) -> Game:
         """Runs a Doddle game.
 
         Args:
             solution (Word): The solution
             user_guesses (list[Word]): A list of user-supplied, opening guesses
+            opening (tuple[Word, dict[int, WordSeries]] | None, optional):
+                A precomputed opening as returned by Engine.opening. Defaults to None.
 
         Raises:
             FailedToFindASolutionError: If no solution is found
@@ -37,22 +66,90 @@ class Engine:
             Game: A Game object summarising the simulation.
         """
 
-        all_words, available_answers = self.dictionary.words
+        _, available_answers = self.dictionary.words
         game = Game(available_answers, solution, user_guesses)
-        guess = game.user_guess(0) or self.solver.seed(all_words.word_length)
+        reports = _reports(self.reporter)
+        for i, guess, score, remaining_answers in self._play(solution, user_guesses, opening):
+            game.update(i, guess, score, remaining_answers)
+            if reports:
+                self.reporter.display(game)
+
+        return game
+
+    def run_rounds(
+        self,
+        solution: Word,
+        user_guesses: list[Word],
+        opening: tuple[Word, dict[int, WordSeries]] | None = None,
+    ) -> int:
+        """Plays a Doddle game without keeping a record of it.
+
+        This is the fast path for benchmarking, where only the number of rounds is needed.
+
+        Args:
+            solution (Word): The solution
+            user_guesses (list[Word]): A list of user-supplied, opening guesses
+            opening (tuple[Word, dict[int, WordSeries]] | None, optional):
+                A precomputed opening as returned by Engine.opening. Defaults to None.
+
+        Raises:
+            FailedToFindASolutionError: If no solution is found
+
+        Returns:
+            int: The number of rounds taken to find the solution.
+        """
+        rounds = 0
+        for rounds, _, _, _ in self._play(solution, user_guesses, opening):
+            pass
+
+        return rounds
+
+    def _play(
+        self,
+        solution: Word,
+        user_guesses: list[Word],
+        opening: tuple[Word, dict[int, WordSeries]] | None,
+    ) -> Iterator[tuple[int, Word, int, WordSeries]]:
+        """Plays a Doddle game, yielding each round until the solution is found.
+
+        Args:
+            solution (Word): The solution
+            user_guesses (list[Word]): A list of user-supplied, opening guesses
+            opening (tuple[Word, dict[int, WordSeries]] | None):
+                A precomputed opening as returned by Engine.opening.
+
+        Raises:
+            FailedToFindASolutionError: If no solution is found
+
+        Yields:
+            Iterator[tuple[int, Word, int, WordSeries]]:
+                The round, the guess, its score and the solutions that remain.
+        """
+        all_words, available_answers = self.dictionary.words
+        if opening:
+            guess, opening_histogram = opening
+        else:
+            guess = user_guesses[0] if user_guesses else self.solver.seed(all_words.word_length)
+            opening_histogram = None
 
-        MAX_ITERS = 20
         for i in range(1, MAX_ITERS + 1):
-            histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
-            score = self.scorer.score_word(solution, guess)
-            available_answers = histogram[score]
-            game.update(i, guess, score, available_answers)
-            self.reporter.display(game)
+            if i == 1 and opening_histogram is not None:
+                score = self.scorer.score_word(solution, guess)
+                available_answers = opening_histogram[score]
+            else:
+                score, available_answers = self.histogram_builder.get_score_and_solns(
+                    available_answers, guess, solution
+                )
+
+            yield i, guess, score, available_answers
 
-            if game.is_solved:
-                return game
+            if self.scorer.is_perfect_score(score):
+                return
 
-            guess = game.user_guess(i) or self.solver.get_best_guess(all_words, available_answers).word
+            if i < len(user_guesses):
+                guess = user_guesses[i]
+            else:
+                guess = self.solver.get_best_guess(all_words, available_answers).word
 
         raise FailedToFindASolutionError(f"Failed to converge after {MAX_ITERS} iterations.")
 
@@ -67,12 +164,36 @@ class SimulEngine:
     solver: SimulSolver[Guess, Guess]
     reporter: RunReporter
 
-    def run(self, solns: list[Word], user_guesses: list[Word]) -> SimultaneousGame:
+    def opening(self, user_guesses: list[Word]) -> tuple[Word, dict[int, WordSeries]]:
+        """Computes the opening guess and the histogram it produces.
+
+        Neither depends on the solutions so, when playing many games, they can be computed
+        once and passed to each run.
+
+        Args:
+            user_guesses (list[Word]): The list of user-supplied, opening guesses
+
+        Returns:
+            tuple[Word, dict[int, WordSeries]]:
+                The opening guess and all the solutions, partitioned by its score.
+        """
+        all_words, common_words = self.dictionary.words
+        guess = user_guesses[0] if user_guesses else self.solver.seed(all_words.word_length)
+        return guess, self.histogram_builder.get_solns_by_score(common_words, guess)
+
+    def run(
+        self,
+        solns: list[Word],
+        user_guesses: list[Word],
+        opening: tuple[Word, dict[int, WordSeries]] | None = None,
+    ) -> SimultaneousGame:
         """Runs a simultaneous Doddle game.
 
         Args:
             solns (list[Word]): The solutions to each game
             user_guesses (list[Word]): The list of user-supplied, opening guesses
+            opening (tuple[Word, dict[int, WordSeries]] | None, optional):
+                A precomputed opening as returned by SimulEngine.opening. Defaults to None.
 
         Raises:
             FailedToFindASolutionError: If no solution is found
@@ -82,24 +203,50 @@ class SimulEngine:
         """
         all_words, common_words = self.dictionary.words
         simul_game = SimultaneousGame(common_words, solns, user_guesses)
-        guess = simul_game.user_guess(0) or self.solver.seed(all_words.word_length)
-
-        MAX_ITERS = 20 + len(solns)
-        for i in range(1, MAX_ITERS + 1):
-            for game in simul_game:
-                if game.is_solved:
-                    continue
+        if opening:
+            guess, opening_histogram = opening
+        else:
+            guess = simul_game.user_guess(0) or self.solver.seed(all_words.word_length)
+            opening_histogram = None
+
+        reports = _reports(self.reporter)
+        max_iters = MAX_ITERS + len(solns)
+        for i in range(1, max_iters + 1):
+            active_games = [game for game in simul_game if not game.is_solved]
+            scores = self.scorer.score_words([game.soln for game in active_games], guess).tolist()
+
+            # Games that have not yet diverged share the same potential solutions, so
+            # each distinct set is scored once per round and split into just the buckets
+            # its games fall into. Games landing in the same bucket keep sharing it.
+            scores_by_id: dict[int, list[int]] = defaultdict(list)
+            for game, score in zip(active_games, scores):
+                scores_by_id[id(game.potential_solns)].append(score)
+
+            histogram_by_id: dict[int, dict[int, WordSeries]] = {}
+            if i == 1 and opening_histogram is not None:
+                histogram_by_id[id(common_words)] = opening_histogram
+
+            for game, score in zip(active_games, scores):
                 available_answers = game.potential_solns
-                histogram = self.histogram_builder.get_solns_by_score(available_answers, guess)
-                score = self.scorer.score_word(game.soln, guess)
-                new_available_answers = histogram[score]
-                simul_game.update(i, game, guess, score, new_available_answers)
+                histogram = histogram_by_id.get(id(available_answers))
+                if histogram is None:
+                    histogram = self.histogram_builder.get_solns_for_scores(
+                        available_answers, guess, scores_by_id[id(available_answers)]
+                    )
+                    histogram_by_id[id(available_answers)] = histogram
+                simul_game.update(i, game, guess, score, histogram[score])
 
-            self.reporter.display(simul_game)
+            if reports:
+                self.reporter.display(simul_game)
 
             if simul_game.is_solved:
                 return simul_game
 
             guess = simul_game.user_guess(i) or self.solver.get_best_guess(all_words, simul_game).word
 
-        raise FailedToFindASolutionError(f"Failed to converge after {MAX_ITERS} iterations.")
+        raise FailedToFindASolutionError(f"Failed to converge after {max_iters} iterations.")
+
+
+def _reports(reporter: RunReporter) -> bool:
+    """Whether a reporter shows anything, i.e. whether it is worth calling every round."""
+    return not isinstance(reporter, NullRunReporter)
@@ -22,10 +22,9 @@ class SolverType(Enum):
         Returns:
             SolverType: The enum
         """
-        if value.upper() == "MINIMAX":
-            return SolverType.MINIMAX
-        if value.upper() == "ENTROPY":
-            return SolverType.ENTROPY
-        supported_types = ", ".join([e.name for e in SolverType])
-        message = f"{value} not a supported solver type. Supported types are {supported_types}."
-        raise ValueError(message)
+        try:
+            return SolverType[value.upper()]
+        except KeyError:
+            supported_types = ", ".join([e.name for e in SolverType])
+            message = f"{value} not a supported solver type. Supported types are {supported_types}."
+            raise ValueError(message) from None
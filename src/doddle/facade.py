@@ -10,7 +10,7 @@ from .factory import create_models
 from .solver import EntropySolver
 from .tree import TreeBuilder
 from .views import NullRunReporter
-from .words import Word
+from .words import Word, WordSeries
 
 WordType = Union[str, Word]
 
@@ -142,7 +142,10 @@ class Doddle:
 
         size = len(solns[0])
 
-        missized_solns = [s.value for s in solns if len(s) != self.size]
+        score_matrix = self.engine.histogram_builder.score_matrix
+        missized_solns, unknown_solns = self.__find_invalid(solns, score_matrix.potential_solns)
+        missized_guesses, unknown_words = self.__find_invalid(guesses, score_matrix.all_words)
+
         if missized_solns:
             message = f"All answers must be of length {self.size}: ({', '.join(missized_solns)}). "
             message += "To play Doddle with custom word lengths, please use the size argument when "
@@ -150,7 +153,6 @@ class Doddle:
             message += f"e.g.\n    doddle = Doddle(size={size})"
             raise ValueError(message)
 
-        missized_guesses = [g.value for g in guesses if len(g) != self.size]
         if missized_guesses:
             message = f'All guesses must be of size {self.size}: ({", ".join(missized_guesses)}). '
             message += "To play Doddle with custom word lengths, please use the size argument when "
@@ -158,9 +160,6 @@ class Doddle:
             message += f"e.g.\n    doddle = Doddle(size={len(missized_guesses[0])})"
             raise ValueError(message)
 
-        score_matrix = self.engine.histogram_builder.score_matrix
-
-        unknown_solns = [s.value for s in solns if s not in score_matrix.potential_solns]
         if unknown_solns:
             missing = ", ".join(unknown_solns)
             missing_extras = "', '".join(unknown_solns)
@@ -170,7 +169,6 @@ class Doddle:
             message += f"e.g.  doddle = Doddle(size={size}, ..., extras=['{answer}'])"
             raise ValueError(message)
 
-        unknown_words = [g.value for g in guesses if g not in score_matrix.all_words]
         if unknown_words:
             missing = ", ".join(unknown_words)
             missing_extras = "', '".join(unknown_words)
@@ -214,6 +212,32 @@ class Doddle:
         comma_separated_values = root_node.csv(False)
         return Benchmark.from_csv(comma_separated_values, False)
 
+    def __find_invalid(self, words: list[Word], known_words: WordSeries) -> tuple[list[str], list[str]]:
+        """Finds the words of the wrong length and the words Doddle does not know in one pass.
+
+        A word of the wrong length cannot be a known word, so it is not looked up.
+
+        Args:
+          words (list[Word]):
+            The words to validate.
+
+          known_words (WordSeries):
+            The words that Doddle accepts in this role.
+
+        Returns:
+          tuple[list[str], list[str]]:
+            The words of the wrong length and the unknown words.
+        """
+        missized: list[str] = []
+        unknown: list[str] = []
+        for word in words:
+            if len(word) != self.size:
+                missized.append(word.value)
+            elif word not in known_words:
+                unknown.append(word.value)
+
+        return missized, unknown
+
     @staticmethod
     def __to_word_list(words: WordType | Sequence[WordType] | None, label: str) -> list[Word]:
         if words is None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Sequence
+from functools import lru_cache
+from typing import Callable, Sequence
 
 from .benchmarking import Benchmarker, BenchmarkReporter, SimulBenchmarker
 from .engine import Engine, SimulEngine
@@ -14,6 +15,23 @@ from .solver import DeepEntropySolver, DeepMinimaxSolver, EntropySolver, Minimax
 from .views import NullRunReporter, RunReporter
 from .words import Dictionary, Word, load_dictionary
 
+# The solver, the solver wrapped around it per extra level of depth and the simultaneous
+# solver for each solver type.
+_SOLVERS: dict[
+    SolverType,
+    tuple[
+        Callable[[HistogramBuilder], Solver[Guess]],
+        Callable[..., Solver[Guess]],
+        Callable[[HistogramBuilder], SimulSolver[Guess, Guess]],
+    ],
+] = {
+    SolverType.MINIMAX: (MinimaxSolver, DeepMinimaxSolver, MinimaxSimulSolver),
+    SolverType.ENTROPY: (EntropySolver, DeepEntropySolver, EntropySimulSolver),
+}
+
+# Each set of models can hold a full score matrix, so only the most recent few are kept.
+MAX_CACHED_MODELS = 4
+
 
 def create_simul_engine(
     size: int,
@@ -99,30 +117,31 @@ def create_models(
     extras: Sequence[Word] | None = None,
     lazy_eval: bool = True,
 ) -> tuple[Dictionary, Scorer, HistogramBuilder, Solver[Guess], SimulSolver[Guess, Guess]]:
+    # The dictionary, scorer and histogram builder only ever add to what they have computed,
+    # so they are shared by every solver built for the same words. Solvers are cheap, so
+    # a fresh chain is wrapped around them each time.
+    dictionary, scorer, histogram_builder = _create_shared_models(size, tuple(extras or ()), lazy_eval)
+
+    try:
+        solver_cls, deep_solver_cls, simul_solver_cls = _SOLVERS[solver_type]
+    except KeyError:
+        raise SolverNotSupportedError(f"Solver type {solver_type} not recognised.") from None
+
+    solver = solver_cls(histogram_builder)
+    for _ in range(1, depth):
+        solver = deep_solver_cls(histogram_builder, solver)
+    simul_solver = simul_solver_cls(histogram_builder)
+
+    return dictionary, scorer, histogram_builder, solver, simul_solver
+
 
+@lru_cache(maxsize=MAX_CACHED_MODELS)
+def _create_shared_models(
+    size: int, extras: tuple[Word, ...], lazy_eval: bool
+) -> tuple[Dictionary, Scorer, HistogramBuilder]:
     dictionary = load_dictionary(size, extras=extras)
     all_words, potential_solns = dictionary.words
 
     scorer = Scorer(size)
     histogram_builder = HistogramBuilder(scorer, all_words, potential_solns, lazy_eval)
-
-    solver: Solver[Guess]
-    simul_solver: SimulSolver[Guess, Guess]
-    if solver_type == SolverType.MINIMAX:
-        minimax_solver = MinimaxSolver(histogram_builder)
-        for _ in range(1, depth):
-            minimax_solver = DeepMinimaxSolver(histogram_builder, minimax_solver)
-        solver = minimax_solver
-        simul_solver = MinimaxSimulSolver(histogram_builder)
-
-    elif solver_type == SolverType.ENTROPY:
-        entropy_solver = EntropySolver(histogram_builder)
-        for _ in range(1, depth):
-            entropy_solver = DeepEntropySolver(histogram_builder, entropy_solver)
-        solver = entropy_solver
-        simul_solver = EntropySimulSolver(histogram_builder)
-
-    else:
-        raise SolverNotSupportedError(f"Solver type {solver_type} not recognised.")
-
-    return dictionary, scorer, histogram_builder, solver, simul_solver
+    return dictionary, scorer, histogram_builder
@@ -47,6 +47,16 @@ class Game:
     and the real-time scoreboard.
     """
 
+    __slots__ = [
+        "potential_solns",
+        "soln",
+        "scoreboard",
+        "is_solved",
+        "word_length",
+        "opening_guesses",
+        "_winning_score",
+    ]
+
     def __init__(self, potential_solns: WordSeries, soln: Word, opening_guesses: list[Word]) -> None:
         """Initialises a new instance of the Game object.
 
@@ -62,6 +72,8 @@ class Game:
         self.is_solved = False
         self.word_length = potential_solns.word_length
         self.opening_guesses = opening_guesses
+        # A game is won when every tile is green, i.e. every ternary digit is a 2.
+        self._winning_score = 3**self.word_length - 1
 
     def update(self, n: int, guess: Word, score: int, potential_solns: WordSeries) -> ScoreboardRow:
         """Updates the status of the game after each move is played.
@@ -78,7 +90,7 @@ class Game:
         ternary_score = to_ternary(score, self.word_length)
         self.potential_solns = potential_solns
         row = self.scoreboard.add_row(n, self.soln, guess, ternary_score, len(potential_solns))
-        self.is_solved = all([s == "2" for s in list(ternary_score)])
+        self.is_solved = score == self._winning_score
         return row
 
     @property
@@ -121,6 +133,8 @@ class SimultaneousGame:
     global real-time scoreboard and individual Game objects.
     """
 
+    __slots__ = ["games", "scoreboard", "is_solved", "word_length", "_num_unsolved"]
+
     def __init__(self, potential_solns: WordSeries, solns: list[Word], user_guess: list[Word]) -> None:
         """Initialises a new instance of the SimultaneousGame object.
 
@@ -133,6 +147,7 @@ class SimultaneousGame:
         self.games = [Game(potential_solns, soln, user_guess) for soln in solns]
         self.scoreboard = Scoreboard()
         self.is_solved = False
+        self._num_unsolved = len(self.games)
         self.word_length = potential_solns.word_length
 
     @property
@@ -160,9 +175,11 @@ class SimultaneousGame:
             ScoreboardRow: The row added to the internal scoreboard.
         """
 
+        was_solved = game.is_solved
         row = game.update(n, guess, score, potential_solns)
-        self.scoreboard.rows.append(row)
-        self.is_solved = all((g.is_solved for g in self.games))
+        self.scoreboard.append(row)
+        self._num_unsolved += was_solved - game.is_solved
+        self.is_solved = self._num_unsolved == 0
         return row
 
     def __iter__(self) -> Iterator[Game]:
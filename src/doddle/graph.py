@@ -10,67 +10,91 @@ GREY = "#787c7e"
 YELLOW = "#c9b458"
 GREEN = "#6aaa64"
 
+_CELL_TEMPLATE_BY_TIGIT = {
+    tigit: f'                    <td bgcolor="{color}" width="22" height="22">'
+    '<font face="Helvetica" color="white">%s</font></td>'
+    for tigit, color in zip("012", (GREY, YELLOW, GREEN))
+}
+
 
 class GraphBuilder:
     def __init__(self, scoreboards: Iterable[Scoreboard]) -> None:
-        self.color_by_score = [GREY, YELLOW, GREEN]
-        self.seen: set[tuple[str, str]] = set()
+        self.seen_nodes: set[tuple[str, str]] = set()
+        self.seen_edges: set[tuple[str, str]] = set()
+        self.path_by_step: dict[tuple[str, str], str] = {}
+        self.score_path_by_row: dict[tuple[str, int, str, str], str] = {}
         self.digraph = self._create_digraph()
         self.scoreboards = scoreboards
 
     def build(self) -> "Digraph":
 
         for scoreboard in self.scoreboards:
-            scores = ""
             prev_score_path = ""
             for row in scoreboard.rows:
-                n = row.n
+                guess = str(row.guess)
                 score = row.score
 
-                guess_path = f"{scores}g{n}"
-                self.add_node(guess_path, str(row.guess))
-                self.add_edge(prev_score_path, guess_path)
+                # A row already drawn from the same node adds nothing new to the graph.
+                key = prev_score_path, row.n, guess, score
+                score_path = self.score_path_by_row.get(key)
+                if score_path is None:
+                    guess_path = self._child_path(prev_score_path, f"g{row.n}")
+                    self.add_node(guess_path, guess)
+                    self.add_edge(prev_score_path, guess_path)
 
-                score_path = f"{scores}{score}"
-                self.add_node_html(score_path, str(row.guess), score)
-                self.add_edge(guess_path, score_path)
+                    score_path = self._child_path(prev_score_path, score)
+                    self.add_node_html(score_path, guess, score)
+                    self.add_edge(guess_path, score_path)
+                    self.score_path_by_row[key] = score_path
 
-                scores += f"{score}-"
                 prev_score_path = score_path
 
         return self.digraph
 
+    def _child_path(self, parent: str, step: str) -> str:
+        """Returns the path of a child node, sharing one string per unique path.
+
+        Games that follow the same branch of the tree reuse the path strings
+        built by earlier games instead of re-concatenating their prefixes.
+
+        Args:
+            parent (str): The path of the parent node ("" for the root).
+            step (str): The step from the parent to the child.
+
+        Returns:
+            str: The path of the child node.
+        """
+        key = parent, step
+        path = self.path_by_step.get(key)
+        if path is None:
+            path = f"{parent}-{step}" if parent else step
+            self.path_by_step[key] = path
+        return path
+
     def add_edge(self, path1: str, path2: str) -> None:
         pair = path1, path2
-        if path1 == "" or pair in self.seen:
+        if path1 == "" or pair in self.seen_edges:
             return
 
         self.digraph.edge(path1, path2)
-        self.seen.add(pair)
+        self.seen_edges.add(pair)
 
     def add_node(self, path: str, label: str) -> None:
         pair = path, label
-        if pair in self.seen:
+        if pair in self.seen_nodes:
             return
 
         self.digraph.node(path, label=label)
-        self.seen.add(pair)
+        self.seen_nodes.add(pair)
 
     def add_node_html(self, path: str, label: str, ternary: str) -> None:
         pair = path, label
-        if pair in self.seen:
+        if pair in self.seen_nodes:
             return
 
-        cells = []
-        for letter, tigit in zip(label, ternary):
-            idx = int(tigit)
-            color = self.color_by_score[idx]
-            cell = (
-                f'                    <td bgcolor="{color}" width="22" height="22">'
-                f'<font face="Helvetica" color="white">{letter}</font></td>'
-            )
-            cells.append(cell)
-        all_cells = "\n".join(cells)
+        all_cells = "\n".join(
+            _CELL_TEMPLATE_BY_TIGIT[tigit] % letter for letter, tigit in zip(label, ternary)
+        )
 
         html = f"""<
             <table border="0" cellborder="0" cellspacing="2">
@@ -79,7 +103,7 @@ class GraphBuilder:
                 </tr>
             </table>>"""
         self.digraph.node(path, label=html)
-        self.seen.add(pair)
+        self.seen_nodes.add(pair)
 
     @staticmethod
     def _create_digraph() -> "Digraph":
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import isclose
 from typing import Protocol
 
 import numpy as np
 
 from .words import Word
 
+# Floats no further apart than FLOAT_TOLERANCE are treated as equal when ranking guesses.
+FLOAT_TOLERANCE = 1e-9
+
 
 class Guess(Protocol):  # pragma: no cover
     """Strucural protocol for a guess."""
@@ -158,7 +160,8 @@ class EntropyGuess:
             bool: Whether the guess improves upon the other guess.
         """
 
-        if not isclose(self.entropy, other.entropy, abs_tol=1e-9):
+        # Two infinite entropies differ by nan, so they are treated as equal.
+        if abs(self.entropy - other.entropy) > FLOAT_TOLERANCE:
             return self.entropy > other.entropy
 
         if self.is_potential_soln != other.is_potential_soln:
@@ -241,7 +244,7 @@ class MinimaxSimulGuess:
             bool: Whether the guess improves upon the other guess.
         """
 
-        if not isclose(self.pct_left, other.pct_left, abs_tol=1e-9):
+        if abs(self.pct_left - other.pct_left) > FLOAT_TOLERANCE:
             return self.pct_left < other.pct_left
 
         if self.min != other.min:
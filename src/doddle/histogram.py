@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from multiprocessing import current_process
 from multiprocessing.shared_memory import SharedMemory
-from typing import Callable, Iterator, TypeVar
+from typing import Callable, Iterable, Iterator, TypeVar
 
 import numpy as np
 from numba import njit  # type: ignore
@@ -62,8 +62,7 @@ class HistogramBuilder:
             dict[int, WordSeries]: A dictionary of potential solutions, partitioned by score.
         """
 
-        score_func = np.vectorize(self.scorer.score_word)
-        scores = score_func(potential_solns.words, guess)
+        scores = self._score(potential_solns, guess)
         unique_scores, positions = np.unique(scores, return_inverse=True)
 
         solns_by_score: dict[int, WordSeries] = {}
@@ -74,6 +73,67 @@ class HistogramBuilder:
 
         return solns_by_score
 
+    def get_score_and_solns(
+        self, potential_solns: WordSeries, guess: Word, soln: Word
+    ) -> tuple[int, WordSeries]:
+        """Scores a guess against a solution and keeps the solutions consistent with that score.
+
+        This is the bucket of the histogram that the solution falls into, without the cost of
+        building the other buckets or scoring the solution a second time.
+
+        Args:
+            potential_solns (WordSeries): The remaining words that could be a solution.
+            guess (Word): The guess.
+            soln (Word): The solution.
+
+        Returns:
+            tuple[int, WordSeries]: The score and the remaining solutions that share it.
+        """
+
+        scores = self._score(potential_solns, guess)
+        pos = potential_solns.find_index(soln)
+        score = int(scores[pos]) if pos >= 0 else self.scorer.score_word(soln, guess)
+
+        return score, potential_solns[scores == score]
+
+    def get_solns_for_scores(
+        self, potential_solns: WordSeries, guess: Word, scores: Iterable[int]
+    ) -> dict[int, WordSeries]:
+        """Gets the buckets of the histogram for the given scores only.
+
+        The guess is scored against the remaining solutions once and the other buckets
+        are never built.
+
+        Args:
+            potential_solns (WordSeries): The remaining words that could be a solution.
+            guess (Word): The guess.
+            scores (Iterable[int]): The scores whose buckets are needed.
+
+        Returns:
+            dict[int, WordSeries]: The remaining solutions that share each of the scores.
+        """
+
+        all_scores = self._score(potential_solns, guess)
+        return {score: potential_solns[all_scores == score] for score in set(scores)}
+
+    def _score(self, potential_solns: WordSeries, guess: Word) -> np.ndarray:
+        """Scores a guess against each potential solution.
+
+        Scores are read from the score matrix where it has already been computed and
+        are otherwise calculated in a single batched call.
+
+        Args:
+            potential_solns (WordSeries): The remaining words that could be a solution.
+            guess (Word): The guess.
+
+        Returns:
+            np.ndarray: The score against each potential solution.
+        """
+        scores = self.score_matrix.scores(guess, potential_solns)
+        if scores is None:
+            scores = self.scorer.score_words(potential_solns.words, guess)
+        return scores
+
     def stream(
         self,
         all_words: WordSeries,
@@ -112,6 +172,32 @@ class HistogramBuilder:
             is_potential_soln = _populate_histogram(scores, i, histogram)
             yield guess_factory(word, is_potential_soln, histogram)
 
+    def summarise(
+        self, all_words: WordSeries, potential_solns: WordSeries
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Summarises the histogram of every possible guess in a single compiled pass.
+
+        This is the same information that stream(...) hands to each guess factory, but
+        without yielding to the interpreter once per word.
+
+        Args:
+          all_words (WordSeries):
+            The list of all words that could be guessed
+
+          potential_solns (WordSeries):
+            The remaining words that could be solutions
+
+        Returns:
+          tuple[np.ndarray, np.ndarray, np.ndarray]:
+            For each word in all_words: the size of its largest bucket, its number of
+            (non-empty) buckets and whether it could be a solution.
+        """
+        self.score_matrix.precompute(potential_solns)
+        storage = self.score_matrix._storage
+        return _summarise_histograms(
+            storage, len(all_words), potential_solns.index, 3**all_words.word_length
+        )
+
     @staticmethod
     def _allocate_histogram_vector(word_length: int) -> np.ndarray:
         """Allocates a vector that can be recycled.
@@ -125,6 +211,21 @@ class HistogramBuilder:
         return np.zeros(3**word_length, dtype=int)
 
 
+def _score_dtype(word_length: int) -> np.dtype:
+    """The narrowest signed integer type that holds every score (and -1, for unscored).
+
+    Rows of the score matrix are read on every guess, so fewer bytes per score means
+    less memory traffic: int16 covers every word length up to 9.
+
+    Args:
+        word_length (int): The word length of the game.
+
+    Returns:
+        np.dtype: The data type.
+    """
+    return np.min_scalar_type(-(3**word_length))
+
+
 def to_histogram(solns_by_score: dict[int, WordSeries]) -> np.ndarray:
     length = max(solns_by_score) + 1
     vector = np.zeros(shape=(length,))
@@ -134,7 +235,7 @@ def to_histogram(solns_by_score: dict[int, WordSeries]) -> np.ndarray:
     return vector
 
 
-@njit
+@njit(cache=True)
 def _populate_histogram(matrix: np.ndarray, row: int, hist: np.ndarray) -> bool:
     """Aggressive optimisation of the histogram creation.
 
@@ -162,6 +263,50 @@ def _populate_histogram(matrix: np.ndarray, row: int, hist: np.ndarray) -> bool:
     return is_potential_soln
 
 
+@njit(cache=True)
+def _summarise_histograms(
+    matrix: np.ndarray, num_rows: int, cols: np.ndarray, num_scores: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Summarises the histogram of each of the first num_rows rows of the score matrix.
+
+    Like _populate_histogram, a single preallocated histogram is recycled for every
+    row; the largest bucket and the number of buckets are tracked as it fills. The
+    columns are read in place rather than copied out of the (large) matrix first.
+
+    Args:
+        matrix (np.ndarray): The internal, precomputed score matrix
+        num_rows (int): The number of rows (i.e. guesses) to summarise
+        cols (np.ndarray): The columns corresponding to the potential solutions
+        num_scores (int): The number of possible scores
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]:
+            The size of the largest bucket, the number of buckets and whether the
+            guess is a potential solution for each row.
+    """
+    largest = np.zeros(num_rows, dtype=np.int64)
+    num_buckets = np.zeros(num_rows, dtype=np.int64)
+    is_potential_soln = np.zeros(num_rows, dtype=np.bool_)
+    hist = np.zeros(num_scores, dtype=np.int64)
+    for i in range(num_rows):
+        row = matrix[i]
+        hist[:] = 0
+        row_largest = 0
+        row_num_buckets = 0
+        for j in range(cols.shape[0]):
+            idx = row[cols[j]]
+            count = hist[idx] + 1
+            hist[idx] = count
+            if count == 1:
+                row_num_buckets += 1
+            if count > row_largest:
+                row_largest = count
+        largest[i] = row_largest
+        num_buckets[i] = row_num_buckets
+        is_potential_soln[i] = hist[-1] > 0
+    return largest, num_buckets, is_potential_soln
+
+
 class MemoryMappedStorage:
     def __init__(self, data: np.ndarray) -> None:
         self.shared_memory = self.create_shared_memory_block(data)
@@ -220,7 +365,7 @@ class ScoreMatrix(MemoryMappedStorage):
             lazy_eval (bool, optional): Whether to perform lazy evaluation. Defaults to True.
         """
         rows, cols = all_words.index.max() + 1, potential_solns.index.max() + 1
-        storage = np.full((rows, cols), -1, dtype=int)
+        storage = np.full((rows, cols), -1, dtype=_score_dtype(all_words.word_length))
 
         self.is_calculated = np.zeros(cols, dtype=bool)
         self.is_fully_initialized = False
@@ -245,11 +390,23 @@ class ScoreMatrix(MemoryMappedStorage):
         if self.is_fully_initialized or np.all(self.is_calculated[solns.index]):
             return
 
-        row_words = self.all_words.words[np.newaxis, :]
-        col_words = solns.words[:, np.newaxis]
-
-        # TODO investigate performance of np.vectorize
-        func = np.vectorize(self.scorer.score_word)
-        self._storage[:, solns.index] = func(col_words, row_words).T
+        self._storage[:, solns.index] = self.scorer.score_all(self.all_words.words, solns.words)
         self.is_calculated[solns.index] = True
         self.is_fully_initialized = bool(np.all(self.is_calculated))
+
+    def scores(self, guess: Word, potential_solns: WordSeries) -> np.ndarray | None:
+        """Looks up the precomputed scores of a guess against some potential solutions.
+
+        Args:
+            guess (Word): The guess.
+            potential_solns (WordSeries): The potential solutions.
+
+        Returns:
+            np.ndarray | None:
+                The score against each potential solution, or None if the guess is
+                unknown or any of the scores have not been computed yet.
+        """
+        row = self.all_words.find_index(guess)
+        if row < 0 or not np.all(self.is_calculated[potential_solns.index]):
+            return None
+        return self._storage[row, potential_solns.index]
@@ -1,8 +1,17 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from itertools import product
+from typing import Sequence
+
 import numpy as np
-from numba import int8, int32, jit  # type: ignore
+from numba import int8, int32, jit, njit  # type: ignore
 
 from .words import Word
 
+# Longest word for which every ternary score is tabulated (3**10 = 59,049 strings).
+MAX_TABULATED_SIZE = 10
+
 
 class Scorer:
     """A class to score a guess given a solution."""
@@ -71,41 +80,113 @@ class Scorer:
         # return score_word_slow(solution.value, guess.value) # (x50 slower!)
         return _score_word_jit(solution.vector, guess.vector, self._powers)
 
+    def score_words(self, solutions: Sequence[Word] | np.ndarray, guess: Word) -> np.ndarray:
+        """Calculates the score of a guess against each of many solutions in one call.
 
-@jit(int32(int8[:], int8[:], int32[:]), nopython=True)
-def _score_word_jit(solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray) -> int:
-    """Optimised internal call to score a word. See Solver.score_word(...) for details."""
+        Args:
+            solutions (Sequence[Word] | np.ndarray): The solutions.
+            guess (Word): The guess.
 
-    matches = solution_array == guess_array
+        Returns:
+            np.ndarray: The score against each solution. See Scorer.score_word(...) for details.
+        """
+        if len(solutions) == 0:
+            return np.empty(0, dtype=np.int32)
+
+        solution_matrix = np.stack([solution.vector for solution in solutions])
+        return _score_words_jit(solution_matrix, guess.vector, self._powers)
+
+    def score_all(
+        self, guesses: Sequence[Word] | np.ndarray, solutions: Sequence[Word] | np.ndarray
+    ) -> np.ndarray:
+        """Calculates the score of every guess against every solution in one call.
+
+        Args:
+            guesses (Sequence[Word] | np.ndarray): The guesses.
+            solutions (Sequence[Word] | np.ndarray): The solutions.
+
+        Returns:
+            np.ndarray: A (guesses, solutions) matrix of scores. See Scorer.score_word(...).
+        """
+        if len(guesses) == 0 or len(solutions) == 0:
+            return np.empty((len(guesses), len(solutions)), dtype=np.int32)
+
+        guess_matrix = np.stack([guess.vector for guess in guesses])
+        solution_matrix = np.stack([solution.vector for solution in solutions])
+        return _score_all_jit(guess_matrix, solution_matrix, self._powers)
 
+
+@njit(cache=True, inline="always")
+def _score_word_into(
+    solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray, matches: np.ndarray
+) -> int:
+    """Scores a word, recording its exact matches in a caller-supplied buffer.
+
+    Reusing the buffer lets batch kernels score many pairs without allocating an array
+    for each. See Scorer.score_word(...) for details.
+    """
     value = 0
-    for (i, is_match) in enumerate(matches):
-        if is_match:
+    for i in range(len(guess_array)):
+        matches[i] = solution_array[i] == guess_array[i]
+        if matches[i]:
             value += 2 * powers[i]
 
-    for (i, is_match) in enumerate(matches):
-        if is_match:
+    for i in range(len(guess_array)):
+        if matches[i]:
             continue
 
         letter = guess_array[i]
         num_times_already_observed = 0
         for j in range(i):
-            if not matches[j]:
-                num_times_already_observed += letter == guess_array[j]
+            if not matches[j] and letter == guess_array[j]:
+                num_times_already_observed += 1
 
         num_times_in_solution = 0
-        for (j, is_match_j) in enumerate(matches):
-            if is_match_j:
-                continue
-            soln_letter = solution_array[j]
-            num_times_in_solution += int(letter == soln_letter)
+        for j in range(len(solution_array)):
+            if not matches[j] and letter == solution_array[j]:
+                num_times_in_solution += 1
 
-        is_partial_match = num_times_already_observed < num_times_in_solution
-        value += int(powers[i] * is_partial_match)
+        if num_times_already_observed < num_times_in_solution:
+            value += powers[i]
 
     return value
 
 
+@jit(int32(int8[:], int8[:], int32[:]), nopython=True, cache=True)
+def _score_word_jit(solution_array: np.ndarray, guess_array: np.ndarray, powers: np.ndarray) -> int:
+    """Optimised internal call to score a word. See Solver.score_word(...) for details."""
+    matches = np.empty(len(guess_array), dtype=np.bool_)
+    return _score_word_into(solution_array, guess_array, powers, matches)
+
+
+@njit(cache=True)
+def _score_words_jit(
+    solution_matrix: np.ndarray, guess_array: np.ndarray, powers: np.ndarray
+) -> np.ndarray:
+    """Scores a guess against each row of a matrix of solutions. See Scorer.score_words(...)."""
+    scores = np.empty(solution_matrix.shape[0], dtype=np.int32)
+    for i in range(solution_matrix.shape[0]):
+        scores[i] = _score_word_jit(solution_matrix[i], guess_array, powers)
+    return scores
+
+
+@njit(cache=True)
+def _score_all_jit(
+    guess_matrix: np.ndarray, solution_matrix: np.ndarray, powers: np.ndarray
+) -> np.ndarray:
+    """Scores each row of a matrix of guesses against each row of a matrix of solutions.
+
+    This is _score_word_jit(...) for every pair, but with one recycled buffer of matches
+    rather than allocating an array per pair, which would otherwise dominate.
+    """
+    matches = np.empty(guess_matrix.shape[1], dtype=np.bool_)
+    scores = np.empty((guess_matrix.shape[0], solution_matrix.shape[0]), dtype=np.int32)
+    for g in range(guess_matrix.shape[0]):
+        for s in range(solution_matrix.shape[0]):
+            scores[g, s] = _score_word_into(solution_matrix[s], guess_matrix[g], powers, matches)
+    return scores
+
+
 def score_word_slow(soln: str, guess: str) -> int:
     """
     This is no longer used but is kept because it is a more
@@ -168,4 +249,13 @@ def to_ternary(score: int, size: int) -> str:
     Returns:
         str: The ternary score.
     """
+    if size <= MAX_TABULATED_SIZE:
+        return _ternary_scores(size)[score]
+
     return np.base_repr(score, base=3).zfill(size)
+
+
+@lru_cache(maxsize=None)
+def _ternary_scores(size: int) -> tuple[str, ...]:
+    """Every ternary score for a given word length, indexed by its decimal equivalent."""
+    return tuple("".join(digits) for digits in product("012", repeat=size))
@@ -67,6 +67,40 @@ class MinimaxSimulSolver(SimulSolver[MinimaxGuess, MinimaxSimulGuess]):
     def __init__(self, histogram_builder: HistogramBuilder) -> None:
         super().__init__(histogram_builder)
 
+    def get_best_guess(self, all_words: WordSeries, games: SimultaneousGame) -> MinimaxSimulGuess:
+        """See base class."""
+        unsolved_games = [game for game in games if not game.is_solved]
+        if any(len(game.potential_solns) <= 1 for game in unsolved_games):
+            return super().get_best_guess(all_words, games)
+
+        # Summarise every guess against each board in a compiled pass and combine them
+        # as to_simul_guess(...) would, but across all words at once.
+        summaries = [
+            self.hist_builder.summarise(all_words, game.potential_solns) for game in unsolved_games
+        ]
+        largest_sizes = np.stack([largest for largest, _, _ in summaries])
+        num_buckets = np.sum([buckets for _, buckets, _ in summaries], axis=0)
+        is_potential_soln = np.any([is_soln for _, _, is_soln in summaries], axis=0)
+        num_solutions = np.array([len(game.potential_solns) for game in unsolved_games])
+        pct_left = np.prod(largest_sizes / num_solutions[:, np.newaxis], axis=0)
+
+        # Only guesses that leave (near enough) the smallest fraction can win, so only
+        # those are built and ranked in full.
+        candidates = np.flatnonzero(pct_left <= pct_left.min() + 1e-6)
+        simul_guesses = (
+            MinimaxSimulGuess(
+                all_words.iloc[int(i)],
+                bool(is_potential_soln[i]),
+                float(pct_left[i]),
+                int(largest_sizes[:, i].min()),
+                int(largest_sizes[:, i].sum()),
+                int(largest_sizes[:, i].max()),
+                int(num_buckets[i]),
+            )
+            for i in candidates
+        )
+        return min(simul_guesses)
+
     def single_guess(self, guess: Word, is_potential_soln: bool, histogram: np.ndarray) -> MinimaxGuess:
         return MinimaxGuess.from_histogram(guess, is_potential_soln, histogram)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import heapq
 from typing import Generic, Iterator, TypeVar
 
 import numpy as np
@@ -100,6 +101,50 @@ class MinimaxSolver(Solver[MinimaxGuess]):
         seeds = ["OLEA", "RAISE", "TAILER", "TENAILS", "CENTRALS", "SECRETION"]
         return [Word(seed) for seed in seeds]
 
+    def get_best_guess(self, all_words: WordSeries, potential_solns: WordSeries) -> MinimaxGuess:
+        """See base class."""
+        if len(potential_solns) <= 2:
+            return super().get_best_guess(all_words, potential_solns)
+
+        best_guess, *_ = self._best_guesses(all_words, potential_solns, 1)
+        return best_guess
+
+    def _best_guesses(
+        self, all_words: WordSeries, potential_solns: WordSeries, n: int
+    ) -> list[MinimaxGuess]:
+        """Gets the n best guesses, best first.
+
+        Equivalent to heapq.nsmallest(n, self.all_guesses(...)), but ranks the summarised
+        histograms of every word in a few array operations instead of building and comparing
+        a MinimaxGuess per word.
+
+        Args:
+          all_words (WordSeries): The full universe of words.
+          potential_solns (WordSeries): The words that still remain as potential solutions.
+          n (int): The number of guesses.
+
+        Returns:
+          list[MinimaxGuess]: The best guesses.
+        """
+        largest, num_buckets, is_potential_soln = self.hist_builder.summarise(all_words, potential_solns)
+
+        # Guesses rank by the smallest largest bucket, then potential solutions, then the
+        # most buckets and, as all_words is sorted, the first word alphabetically (argmin
+        # returns the first minimum and the sort is stable). Neither count can exceed the
+        # number of potential solutions, so the three keys are packed into one uint64.
+        keys = (
+            (largest.astype(np.uint64) << np.uint64(33))
+            | ((~is_potential_soln).astype(np.uint64) << np.uint64(32))
+            | (np.uint64(0xFFFFFFFF) - num_buckets.astype(np.uint64))
+        )
+        best = [keys.argmin()] if n == 1 else np.argsort(keys, kind="stable")[:n]
+        return [
+            MinimaxGuess(
+                all_words.iloc[int(i)], bool(is_potential_soln[i]), int(num_buckets[i]), int(largest[i])
+            )
+            for i in best
+        ]
+
     def _build_guess(self, word: Word, is_potential_soln: bool, histogram: np.ndarray) -> MinimaxGuess:
         """See base class."""
         return MinimaxGuess.from_histogram(word, is_potential_soln, histogram)
@@ -119,8 +164,7 @@ class DeepMinimaxSolver(MinimaxSolver):
         if len(potential_solns) <= 2:
             return super().get_best_guess(all_words, potential_solns)
 
-        guesses = self.all_guesses(all_words, potential_solns)
-        best_guesses = sorted(guesses)[:N_GUESSES]
+        best_guesses = self._best_guesses(all_words, potential_solns, N_GUESSES)
 
         combined_guesses: list[MinimaxGuess] = []
         for guess in best_guesses:
@@ -128,9 +172,11 @@ class DeepMinimaxSolver(MinimaxSolver):
                 return MinimaxGuess(guess.word, guess.is_potential_soln, 0, 0)
 
             solns_by_score = self.hist_builder.get_solns_by_score(potential_solns, guess.word)
-            worst_scores = sorted(solns_by_score, key=lambda s: -len(solns_by_score[s]))
+            worst_scores = heapq.nlargest(
+                N_BRANCHES, solns_by_score, key=lambda s: len(solns_by_score[s])
+            )
             best_deep_guesses: list[MinimaxGuess] = []
-            for worst_score in worst_scores[:N_BRANCHES]:
+            for worst_score in worst_scores:
                 potential_deep_solns = solns_by_score[worst_score]
                 deep_guess = self.inner.get_best_guess(all_words, potential_deep_solns)
                 best_deep_guesses.append(deep_guess)
@@ -170,7 +216,7 @@ class DeepEntropySolver(EntropySolver):
             return super().get_best_guess(all_words, potential_solns)
 
         guesses = self.all_guesses(all_words, potential_solns)
-        best_guesses = sorted(guesses)[:N_GUESSES]
+        best_guesses = heapq.nsmallest(N_GUESSES, guesses)
 
         combined_guesses: list[EntropyGuess] = []
         for guess in best_guesses:
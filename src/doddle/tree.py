@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass
 from typing import Iterator
 
@@ -48,7 +49,7 @@ class TreeBuilder:
                 continue
 
             guesses = self.solver.all_guesses(self.dictionary.all_words, inner_solns)
-            best_guesses = sorted(guesses)[:N_GUESSES]
+            best_guesses = heapq.nsmallest(N_GUESSES, guesses)
             naive_best_guess = best_guesses[0]
 
             if naive_best_guess.is_perfect_partition:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 from bisect import bisect_left
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, Iterator, Sequence, cast
 
@@ -261,11 +262,11 @@ def load_dictionary(size, extras: Sequence[Word] | None = None) -> Dictionary:
 
     if size == 5:
         # Use the official Wordle list for the real game
-        all_words = _load_from_file("dictionary-full-official.json", size)
-        common_words = _load_from_file("dictionary-answers-official.json", size)
+        all_words = set(_load_from_file("dictionary-full-official.json", size))
+        common_words = set(_load_from_file("dictionary-answers-official.json", size))
     else:
-        all_words = _load_from_file("dictionary-full.json", size)
-        common_words = _load_from_file("dictionary-answers.json", size)
+        all_words = set(_load_from_file("dictionary-full.json", size))
+        common_words = set(_load_from_file("dictionary-answers.json", size))
 
     # Add any extra words in case they're missing from the official dictionary
     # Better to solve an unofficial word than bomb out later.
@@ -273,12 +274,21 @@ def load_dictionary(size, extras: Sequence[Word] | None = None) -> Dictionary:
     common_words.update(extras_str)
     all_words.update(common_words)
 
-    common_series = WordSeries(common_words)
+    # The common words reuse the Word objects of the full list rather than duplicating them.
     all_series = WordSeries(all_words)
+    word_by_value = {word.value: word for word in all_series.words}
+    common_array = np.array([word_by_value[word] for word in sorted(common_words)])
+    common_series = WordSeries(common_array, np.arange(len(common_array)))
     return Dictionary(all_series, common_series)
 
 
-def _load_from_file(file_name: str, size: int) -> set[str]:
+@lru_cache(maxsize=None)
+def _load_from_file(file_name: str, size: int) -> frozenset[str]:
+    """Reads the words of a given length from one of the packaged word lists.
+
+    The unofficial lists hold words of every length in megabytes of JSON, so each
+    is parsed once per word length rather than every time a dictionary is loaded.
+    """
 
     SUB_FOLDER = "dictionaries"
     path = Path(__file__).parent.absolute()
@@ -286,4 +296,4 @@ def _load_from_file(file_name: str, size: int) -> set[str]:
     with open(path / SUB_FOLDER / file_name) as file:
         word_list = json.load(file)
 
-    return {word.upper() for word in word_list if len(word) == size}
+    return frozenset(word.upper() for word in word_list if len(word) == size)
@@ -0,0 +1,13 @@
+from typing import Iterator
+
+import pytest
+
+from doddle import factory
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache() -> Iterator[None]:
+    # Tests patch the dictionary loader, so models must not be shared between tests.
+    factory._create_shared_models.cache_clear()
+    yield
+    factory._create_shared_models.cache_clear()
@@ -1,23 +1,38 @@
 from __future__ import annotations
 
 import os
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
-from unittest.mock import ANY, MagicMock, PropertyMock, patch
+from typing import Any, Callable, Iterable
+from unittest.mock import MagicMock, PropertyMock, patch
 
+import numpy as np
 import pytest
 
 from doddle import benchmarking, factory
 from doddle.benchmarking import Benchmark, BenchmarkPrinter, BenchmarkReporter, NullBenchmarkReporter
 from doddle.boards import Scoreboard
+from doddle.engine import Engine, SimulEngine
 from doddle.exceptions import InvalidWordleBotFileError
 from doddle.game import Game, SimultaneousGame
+from doddle.views import NullRunReporter, RunReporter
 from doddle.words import Word, WordSeries
 
 from .fake_dictionary import load_test_dictionary
 
 
+def _submit_in_process(engine: Engine | SimulEngine) -> Callable[..., Future]:
+    """Fakes ProcessPoolExecutor.submit by playing each chunk in this process."""
+
+    def submit(f: Callable[[Any], Any], chunk: Any) -> Future:
+        benchmarking._init_worker(engine, [])
+        future: Future = Future()
+        future.set_result(f(chunk))
+        return future
+
+    return submit
+
+
 class TestBenchmark:
     def test_statistics(self) -> None:
         # Arrange
@@ -41,6 +56,18 @@ class TestBenchmark:
         assert sut.guesses == guesses
         assert sut.opening_guess == guesses[0]
 
+    @patch.object(Benchmark, "_moments", new_callable=PropertyMock)
+    def test_num_games_uses_known_total(self, patch_moments: MagicMock) -> None:
+        # Arrange
+        sut = Benchmark([], {3: 2, 4: 1}, [], total_games=3)
+
+        # Act
+        num_games = sut.num_games()
+
+        # Assert
+        assert num_games == 3
+        patch_moments.assert_not_called()
+
     def test_repr(self) -> None:
         # Arrange
         def scoreboard_factory(solns: WordSeries) -> Iterable[Scoreboard]:
@@ -158,6 +185,24 @@ class TestBenchmark:
         # Assert
         assert len(benchmark.scoreboards) == 100
 
+    def test_from_csv_in_any_order(self) -> None:
+        # Arrange
+        directory = Path(os.path.dirname(__file__))
+        with open(directory / "wordle_bot_file.txt") as file:
+            lines = file.read().splitlines()
+
+        def rows_by_soln(benchmark: Benchmark) -> dict[str, list[str]]:
+            return {
+                str(sb.rows[-1].soln): [repr(row) for row in sb.rows] for sb in benchmark.scoreboards
+            }
+
+        # Act
+        benchmark = Benchmark.from_csv("\n".join(lines))
+        reversed_benchmark = Benchmark.from_csv("\n".join(reversed(lines)))
+
+        # Assert
+        assert rows_by_soln(reversed_benchmark) == rows_by_soln(benchmark)
+
     def test_read_invalid_csv(self) -> None:
         # Arrange
         directory = Path(os.path.dirname(__file__))
@@ -188,45 +233,171 @@ class TestBenchmark:
         sut.to_csv(path)
 
         # Assert
-        pass
+        (actual_path, lines), _ = patch_write_to_file.call_args
+        expected = [f"START,{soln}" for soln in sorted(str(soln) for soln in solns)]
+        assert actual_path == path
+        assert list(lines) == expected
 
 
 class TestBenchmarker:
     @patch.object(factory, "load_dictionary")
-    @patch.object(ProcessPoolExecutor, "map")
-    def test_benchmark(self, patch_map: MagicMock, patch_load_dictionary: MagicMock) -> None:
+    @patch.object(Engine, "run")
+    @patch.object(ProcessPoolExecutor, "submit")
+    def test_benchmark(
+        self, patch_submit: MagicMock, patch_run: MagicMock, patch_load_dictionary: MagicMock
+    ) -> None:
 
         # Arrange
-        def game_factory(f, solns: WordSeries, chunksize: int) -> Iterable[Game]:
-            for soln in solns:
-                game = Game(WordSeries([soln.value]), soln, [])
-                game.is_solved = True
-                game.scoreboard.add_row(1, soln, Word("GUESS"), "20101", 125)
-                game.scoreboard.add_row(2, soln, soln, "22222", 1)
-                yield game
+        def play_game(soln: Word, user_guesses: list[Word], opening: Any = None) -> Game:
+            game = Game(WordSeries([soln.value]), soln, user_guesses)
+            game.is_solved = True
+            game.scoreboard.add_row(1, soln, Word("GUESS"), "20101", 125)
+            game.scoreboard.add_row(2, soln, soln, "22222", 1)
+            return game
 
         patch_load_dictionary.return_value = load_test_dictionary()
-        patch_map.side_effect = game_factory
+        patch_run.side_effect = play_game
 
         sut = factory.create_benchmarker(5)
         solns = sut.engine.dictionary.common_words
+        patch_submit.side_effect = _submit_in_process(sut.engine)
 
         # Act
         benchmark = sut.run_benchmark([])
 
         # Assert
-        patch_map.assert_called_once_with(ANY, solns, chunksize=20)
+        patch_submit.assert_called()
+        assert patch_run.call_count == len(solns)
         assert benchmark.opening_guess == Word("GUESS")
         assert benchmark.num_games() == len(solns)
+        assert benchmark.histogram == {2: len(solns)}
         assert all(scoreboard.rows[-1].score == "22222" for scoreboard in benchmark.scoreboards)
+        assert [scoreboard.rows[-1].soln for scoreboard in benchmark.scoreboards] == list(solns)
+
+    @patch.object(factory, "load_dictionary")
+    @patch.object(Engine, "run_rounds", return_value=1)
+    @patch.object(Engine, "run")
+    @patch.object(ProcessPoolExecutor, "submit")
+    def test_benchmark_without_collecting_games(
+        self,
+        patch_submit: MagicMock,
+        patch_run: MagicMock,
+        patch_run_rounds: MagicMock,
+        patch_load_dictionary: MagicMock,
+    ) -> None:
+
+        # Arrange
+        patch_load_dictionary.return_value = load_test_dictionary()
+
+        sut = factory.create_benchmarker(5)
+        solns = sut.engine.dictionary.common_words
+        patch_submit.side_effect = _submit_in_process(sut.engine)
+
+        # Act
+        benchmark = sut.run_benchmark([], collect_games=False)
+
+        # Assert
+        patch_run.assert_not_called()
+        assert patch_run_rounds.call_count == len(solns)
+        assert benchmark.scoreboards == []
+        assert benchmark.histogram == {1: len(solns)}
+        assert benchmark.opening_guess == sut.engine.solver.seed(5)
+
+    @patch.object(factory, "load_dictionary")
+    @patch.object(benchmarking, "_partition", return_value=(2, 40))
+    @patch.object(ProcessPoolExecutor, "submit")
+    @patch.object(BenchmarkReporter, "display")
+    def test_benchmark_dispatches_balanced_chunks(
+        self, _: MagicMock, patch_submit: MagicMock, __: MagicMock, patch_load_dictionary: MagicMock
+    ) -> None:
+
+        # Arrange
+        def skip_chunk(f, chunk: list[int]) -> Future:
+            future: Future = Future()
+            future.set_result((np.zeros(benchmarking.MAX_ITERS + 1, dtype=int), []))
+            return future
+
+        patch_load_dictionary.return_value = load_test_dictionary()
+        patch_submit.side_effect = skip_chunk
+
+        sut = factory.create_benchmarker(5)
+        num_solns = len(sut.engine.dictionary.common_words)
+
+        # Act
+        sut.run_benchmark([Word("RAISE")])
+
+        # Assert
+        chunk_sizes = [len(call.args[1]) for call in patch_submit.call_args_list]
+        assert chunk_sizes == [40, 40, num_solns - 80]
+
+    @patch.object(factory, "load_dictionary")
+    @patch.object(benchmarking, "_play_chunks")
+    @patch.object(benchmarking, "ProcessPoolExecutor")
+    @patch.object(BenchmarkReporter, "display")
+    def test_benchmark_silences_the_engine_reporter(
+        self,
+        _: MagicMock,
+        patch_executor: MagicMock,
+        patch_play_chunks: MagicMock,
+        patch_load_dictionary: MagicMock,
+    ) -> None:
+
+        # Arrange
+        patch_load_dictionary.return_value = load_test_dictionary()
+        patch_play_chunks.return_value = (np.zeros(benchmarking.MAX_ITERS + 1, dtype=int), [])
+
+        sut = factory.create_benchmarker(5)
+        sut.engine.reporter = RunReporter()
+
+        # Act
+        sut.run_benchmark([Word("RAISE")])
+
+        # Assert
+        worker_engine, *_ = patch_executor.call_args.kwargs["initargs"]
+        assert isinstance(worker_engine.reporter, NullRunReporter)
+        assert type(sut.engine.reporter) is RunReporter
+
+    @patch.object(factory, "load_dictionary")
+    @patch.object(benchmarking, "_play_chunks")
+    @patch.object(benchmarking, "ProcessPoolExecutor")
+    @patch.object(BenchmarkReporter, "display")
+    def test_benchmark_computes_the_opening_once(
+        self,
+        _: MagicMock,
+        patch_executor: MagicMock,
+        patch_play_chunks: MagicMock,
+        patch_load_dictionary: MagicMock,
+    ) -> None:
+
+        # Arrange
+        patch_load_dictionary.return_value = load_test_dictionary()
+        patch_play_chunks.return_value = (np.zeros(benchmarking.MAX_ITERS + 1, dtype=int), [])
+
+        sut = factory.create_benchmarker(5)
+
+        # Act
+        with patch.object(Engine, "opening", wraps=sut.engine.opening) as patch_opening:
+            sut.run_benchmark([])
+
+        # Assert
+        _, _, opening = patch_executor.call_args.kwargs["initargs"]
+        patch_opening.assert_called_once_with([])
+        opening_guess, opening_histogram = opening
+        assert opening_guess == sut.engine.solver.seed(5)
+        assert sum(map(len, opening_histogram.values())) == len(sut.engine.dictionary.common_words)
 
 
 class TestSimulBenchmarker:
     @patch.object(factory, "load_dictionary")
-    @patch.object(ProcessPoolExecutor, "map")
+    @patch.object(SimulEngine, "run")
+    @patch.object(ProcessPoolExecutor, "submit")
     @patch.object(BenchmarkReporter, "display")
     def test_benchmark(
-        self, patch_display: MagicMock, patch_map: MagicMock, patch_load_dictionary: MagicMock
+        self,
+        patch_display: MagicMock,
+        patch_submit: MagicMock,
+        patch_run: MagicMock,
+        patch_load_dictionary: MagicMock,
     ) -> None:
 
         # Arrange
@@ -237,25 +408,129 @@ class TestSimulBenchmarker:
         sut = factory.create_simul_benchmarker(5)
         solns = sut.engine.dictionary.common_words
 
-        def game_factory(
-            f, solns_factory: Iterable[list[Word]], chunksize: int
-        ) -> Iterable[SimultaneousGame]:
+        def play_game(
+            game_solns: list[Word], user_guesses: list[Word], opening: Any = None
+        ) -> SimultaneousGame:
+            assert len(game_solns) == num_simul
+            game = SimultaneousGame(solns, game_solns, user_guesses)
+            game.is_solved = True
+            return game
 
-            for game_solns in solns_factory:
-                game = SimultaneousGame(solns, game_solns, [])
-                game.is_solved = True
-                yield game
-
-        patch_map.side_effect = game_factory
+        patch_run.side_effect = play_game
+        patch_submit.side_effect = _submit_in_process(sut.engine)
 
         # Act
         benchmark = sut.run_benchmark([], num_simul, num_runs)
 
         # Assert
-        patch_map.assert_called_once_with(ANY, ANY, chunksize=20)
+        patch_submit.assert_called()
+        assert patch_run.call_count == num_runs
         assert benchmark.num_games() == num_runs
 
 
+class TestWorker:
+    def test_run_idx(self) -> None:
+        # Arrange
+        engine = MagicMock()
+        engine.dictionary = load_test_dictionary()
+        guesses = [Word("RAISE")]
+        expected_soln = engine.dictionary.common_words.iloc[3]
+
+        benchmarking._init_worker(engine, guesses)
+
+        # Act
+        benchmarking._run_idx(3)
+
+        # Assert
+        engine.run.assert_called_once_with(expected_soln, user_guesses=guesses, opening=None)
+
+    def test_run_chunk(self) -> None:
+        # Arrange
+        def play_game(i: int) -> Game:
+            soln = Word("SNAKE")
+            game = Game(WordSeries([soln.value]), soln, [])
+            for n in range(1, i + 1):
+                game.scoreboard.add_row(n, soln, soln, "22222", 1)
+            return game
+
+        # Act
+        histogram, scoreboards = benchmarking._run_chunk(play_game, 6, [1, 3, 3, 4])
+
+        # Assert
+        assert list(histogram) == [0, 1, 0, 2, 1, 0]
+        assert [len(scoreboard) for scoreboard in scoreboards] == [1, 3, 3, 4]
+
+    def test_count_rounds(self) -> None:
+        # Act
+        histogram, scoreboards = benchmarking._count_rounds(lambda i: i, 6, [1, 3, 3, 4])
+
+        # Assert
+        assert list(histogram) == [0, 1, 0, 2, 1, 0]
+        assert scoreboards == []
+
+    def test_imap_unordered(self) -> None:
+        # Arrange
+        tasks = iter(range(7))
+
+        # Act
+        with ThreadPoolExecutor(2) as executor:
+            results = list(benchmarking._imap_unordered(executor, lambda i: i * i, tasks, 3))
+
+        # Assert
+        assert sorted(results) == [(i, i * i) for i in range(7)]
+
+    def test_ranges(self) -> None:
+        # Act
+        chunks = list(benchmarking._ranges(7, 3))
+
+        # Assert
+        assert chunks == [range(0, 3), range(3, 6), range(6, 7)]
+
+    @patch.object(benchmarking.os, "process_cpu_count", return_value=8, create=True)
+    def test_partition(self, _: MagicMock) -> None:
+        # Act
+        many_games = benchmarking._partition(2_315)
+        few_games = benchmarking._partition(3)
+
+        # Assert
+        assert many_games == (8, 72)
+        assert few_games == (3, 1)
+
+    @pytest.mark.parametrize(
+        "platform, methods, expected",
+        [
+            ("linux", ["fork", "spawn", "forkserver"], "fork"),
+            ("darwin", ["spawn", "fork", "forkserver"], "forkserver"),
+            ("win32", ["spawn"], "spawn"),
+        ],
+    )
+    def test_mp_context(self, platform: str, methods: list[str], expected: str) -> None:
+        # Arrange
+        with patch.object(benchmarking.sys, "platform", platform), patch.object(
+            benchmarking.multiprocessing, "get_all_start_methods", return_value=methods
+        ), patch.object(benchmarking.multiprocessing, "get_context") as patch_get_context:
+            # Act
+            benchmarking._mp_context()
+
+        # Assert
+        patch_get_context.assert_called_once_with(expected)
+
+    def test_run_simul_idxs(self) -> None:
+        # Arrange
+        engine = MagicMock()
+        engine.dictionary = load_test_dictionary()
+        common_words = engine.dictionary.common_words
+        expected_solns = [common_words.iloc[1], common_words.iloc[4]]
+
+        benchmarking._init_worker(engine, [])
+
+        # Act
+        benchmarking._run_simul_idxs([1, 4])
+
+        # Assert
+        engine.run.assert_called_once_with(expected_solns, user_guesses=[], opening=None)
+
+
 class TestBenchmarkPrinter:
     def test_build_string(self) -> None:
         # Arrange
@@ -310,6 +585,19 @@ Std:      0.595
         # Assert
         assert actual.strip() == expected.strip()
 
+    def test_describe_joins_multiple_guesses(self) -> None:
+        # Arrange
+        guesses = [Word("SALET"), Word("CRONY")]
+        histogram = {3: 2, 4: 1}
+        benchmark = Benchmark(guesses, histogram, [])
+        sut = BenchmarkPrinter()
+
+        # Act
+        actual = sut.describe(benchmark)
+
+        # Assert
+        assert actual.splitlines()[0] == "Guess:    SALET,CRONY"
+
 
 class TestBenchmarkReporter:
     @patch.object(BenchmarkPrinter, "build_string")
@@ -1,7 +1,9 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
 from colorama import Fore
 
+from doddle import boards
 from doddle.boards import (
     EmojiScoreboardPrinter,
     HtmlScoreboardPrinter,
@@ -90,6 +92,54 @@ class TestScoreboard:
         # Assert
         assert actual == expected
 
+    def test_many_reflects_new_rows(self) -> None:
+        # Arrange
+        sut = Scoreboard()
+
+        sut.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        sut.add_row(1, Word("BLAST"), Word("RAISE"), "01010", 23)
+        before = sut.many()
+        sut.add_row(2, Word("ULTRA"), Word("ULTRA"), "22222", 1)
+
+        # Act
+        after = sut.many()
+
+        # Assert
+        assert [len(scoreboard) for scoreboard in before] == [1, 1]
+        assert [len(scoreboard) for scoreboard in after] == [2, 1]
+        assert [scoreboard.rows[0].soln for scoreboard in after] == [Word("ULTRA"), Word("BLAST")]
+
+    def test_many_returns_independent_scoreboards(self) -> None:
+        # Arrange
+        sut = Scoreboard()
+
+        sut.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        sut.add_row(1, Word("BLAST"), Word("RAISE"), "01010", 23)
+        before = sut.many()
+        before[0].add_row(2, Word("ULTRA"), Word("ULTRA"), "22222", 1)
+
+        # Act
+        after = sut.many()
+
+        # Assert
+        assert [len(scoreboard) for scoreboard in after] == [1, 1]
+        assert after[0] is not before[0]
+
+    def test_many_reflects_replaced_rows(self) -> None:
+        # Arrange
+        sut = Scoreboard()
+
+        sut.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        sut.add_row(1, Word("BLAST"), Word("RAISE"), "01010", 23)
+        _ = sut.many()
+        sut.rows[1] = ScoreboardRow(1, Word("ULTRA"), Word("BLAST"), "02101", 1)
+
+        # Act
+        actual = sut.many()
+
+        # Assert
+        assert [len(scoreboard) for scoreboard in actual] == [2]
+
     def test_emoji_repr_dordle(self) -> None:
         # Arrange
         sut = Scoreboard()
@@ -195,7 +245,8 @@ class TestScoreboard:
 
 
 class TestScoreboardPrinter:
-    def test_build_string(self) -> None:
+    @patch.object(boards, "_use_colors", return_value=True)
+    def test_build_string(self, _: MagicMock) -> None:
         # Arrange
         scoreboard = Scoreboard()
         scoreboard.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
@@ -219,6 +270,27 @@ class TestScoreboardPrinter:
         # Assert
         assert scoreboard_str == expected
 
+    def test_print_without_terminal(self, capsys: pytest.CaptureFixture) -> None:
+        # Arrange
+        scoreboard = Scoreboard()
+        scoreboard.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        scoreboard.add_row(2, Word("ULTRA"), Word("URBAN"), "20010", 5)
+        scoreboard.add_row(3, Word("ULTRA"), Word("ULTRA"), "22222", 1)
+
+        sut = ScoreboardPrinter(size=5)
+        boards._use_colors.cache_clear()
+
+        # Act
+        try:
+            sut.print(scoreboard)
+        finally:
+            boards._use_colors.cache_clear()
+
+        # Assert
+        actual = capsys.readouterr().out
+        assert "\x1b[" not in actual
+        assert "| 2 | ULTRA | URBAN | 20010 |     5 |" in actual
+
     def test_print_last_round_if_empty(self) -> None:
         # Arrange
         sut = ScoreboardPrinter(size=5)
@@ -230,6 +302,63 @@ class TestScoreboardPrinter:
         # Assert
         assert expected is None
 
+    def test_print_last_round_of_simultaneous_game(self, capsys: pytest.CaptureFixture) -> None:
+        # Arrange
+        sut = ScoreboardPrinter(size=5)
+        scoreboard = Scoreboard()
+        scoreboard.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        scoreboard.add_row(1, Word("BLAST"), Word("RAISE"), "01010", 23)
+        scoreboard.add_row(2, Word("ULTRA"), Word("BLAST"), "02101", 1)
+        scoreboard.add_row(2, Word("BLAST"), Word("BLAST"), "22222", 1)
+
+        divider = sut.build_divider()
+        row1 = sut.build_row(2, Word("ULTRA"), Word("BLAST"), "02101", 1)
+        row2 = sut.build_row(2, Word("BLAST"), Word("BLAST"), "22222", 1)
+        expected = f"{divider}\n{row1}\n{row2}\n"
+
+        # Act
+        sut.print_last_round(scoreboard)
+
+        # Assert
+        assert capsys.readouterr().out == expected
+
+    def test_print_last_round_of_assigned_rows(self, capsys: pytest.CaptureFixture) -> None:
+        # Arrange
+        sut = ScoreboardPrinter(size=5)
+        scoreboard = Scoreboard()
+        scoreboard.rows = [
+            ScoreboardRow(1, Word("ULTRA"), Word("RAISE"), "01000", 117),
+            ScoreboardRow(1, Word("BLAST"), Word("RAISE"), "01010", 23),
+            ScoreboardRow(2, Word("ULTRA"), Word("BLAST"), "02101", 1),
+            ScoreboardRow(2, Word("BLAST"), Word("BLAST"), "22222", 1),
+        ]
+
+        divider = sut.build_divider()
+        row1 = sut.build_row(2, Word("ULTRA"), Word("BLAST"), "02101", 1)
+        row2 = sut.build_row(2, Word("BLAST"), Word("BLAST"), "22222", 1)
+        expected = f"{divider}\n{row1}\n{row2}\n"
+
+        # Act
+        sut.print_last_round(scoreboard)
+
+        # Assert
+        assert capsys.readouterr().out == expected
+
+    def test_print_last_round_of_single_game(self, capsys: pytest.CaptureFixture) -> None:
+        # Arrange
+        sut = ScoreboardPrinter(size=5)
+        scoreboard = Scoreboard()
+        scoreboard.add_row(1, Word("ULTRA"), Word("RAISE"), "01000", 117)
+        scoreboard.add_row(2, Word("ULTRA"), Word("ULTRA"), "22222", 1)
+
+        expected = sut.build_row(2, Word("ULTRA"), Word("ULTRA"), "22222", 1) + "\n"
+
+        # Act
+        sut.print_last_round(scoreboard)
+
+        # Assert
+        assert capsys.readouterr().out == expected
+
 
 class TestKeyboard:
     def test_with_one_update(self) -> None:
@@ -249,7 +378,7 @@ class TestKeyboard:
         # Assert
         for expected_digit, letters in expected.items():
             for char in letters:
-                actual_digit = sut.digit_by_char[char]
+                actual_digit = sut.digit_by_char.get(char, -1)
                 assert expected_digit == actual_digit
 
     def test_with_two_updates(self) -> None:
@@ -270,12 +399,13 @@ class TestKeyboard:
         # Assert
         for expected_digit, letters in expected.items():
             for char in letters:
-                actual_digit = sut.digit_by_char[char]
+                actual_digit = sut.digit_by_char.get(char, -1)
                 assert expected_digit == actual_digit
 
 
 class TestKeyboardPrinter:
-    def test_printer_string(self) -> None:
+    @patch.object(boards, "_use_colors", return_value=True)
+    def test_printer_string(self, _: MagicMock) -> None:
 
         # Arrange
         keyboard = Keyboard()
@@ -294,6 +424,24 @@ class TestKeyboardPrinter:
         # Assert
         assert expected == actual
 
+    def test_print_without_terminal(self, capsys: pytest.CaptureFixture) -> None:
+        # Arrange
+        keyboard = Keyboard()
+        sut = KeyboardPrinter()
+        keyboard.update("SNAKE", "20101")
+        boards._use_colors.cache_clear()
+
+        # Act
+        try:
+            sut.print(keyboard)
+        finally:
+            boards._use_colors.cache_clear()
+
+        # Assert
+        actual = capsys.readouterr().out
+        assert "\x1b[" not in actual
+        assert "Q  W  E  R  T  Y  U  I  O  P" in actual
+
 
 class TestHtmlScoreboardPrinter:
     @patch.object(HtmlScoreboardPrinter, "build_string")
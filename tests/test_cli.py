@@ -1,7 +1,7 @@
 from sys import argv
 from unittest.mock import MagicMock, patch
 
-from doddle import cli
+from doddle import cli, factory
 from doddle.controllers import HideController, SolveController
 from doddle.enums import SolverType
 from doddle.words import Word
@@ -9,7 +9,7 @@ from doddle.words import Word
 
 class TestMain:
     @patch.object(SolveController, "solve")
-    @patch.object(cli, "create_models")
+    @patch.object(factory, "create_models")
     def test_cli_with_solve(self, patch_create_models: MagicMock, patch_solve: MagicMock) -> None:
         # Arrange
         run_args = ["solve", "--guess=FLAME"]
@@ -34,7 +34,7 @@ class TestMain:
         patch_solve.assert_called_once_with(expected_guess)
 
     @patch.object(HideController, "hide")
-    @patch.object(cli, "create_models")
+    @patch.object(factory, "create_models")
     def test_cli_with_hide(self, patch_create_models: MagicMock, patch_hide: MagicMock) -> None:
         # Arrange
         run_args = ["hide", "--guess=FLAME"]
@@ -53,7 +53,7 @@ class TestMain:
         patch_create_models.assert_called_once_with(expected_size, extras=expected_extras)
         patch_hide.assert_called_once_with(expected_guess)
 
-    @patch.object(cli, "create_engine")
+    @patch.object(factory, "create_engine")
     def test_cli_with_single_run(self, patch_create_engine: MagicMock) -> None:
         # Arrange
         run_args = ["run", "--answer=FLAME"]
@@ -78,7 +78,7 @@ class TestMain:
 
         mock_engine.run.assert_called_once_with(expected_word, [])
 
-    @patch.object(cli, "create_simul_engine")
+    @patch.object(factory, "create_simul_engine")
     def test_cli_with_simul_run(self, patch_create_simul_engine: MagicMock) -> None:
         # Arrange
         run_args = [
@@ -110,7 +110,7 @@ class TestMain:
 
         mock_engine.run.assert_called_once_with(expected_solutions, expected_guesses)
 
-    @patch.object(cli, "create_benchmarker")
+    @patch.object(factory, "create_benchmarker")
     def test_cli_with_single_benchmark(self, patch_create_benchmarker: MagicMock) -> None:
         # Arrange
         run_args = ["benchmark", "--guess=RAISE,LOFTY", "--solver=minimax"]
@@ -133,9 +133,9 @@ class TestMain:
             expected_size, solver_type=expected_solver_type, depth=expected_depth, extras=expected_extras
         )
 
-        mock_benchmarker.run_benchmark.assert_called_once_with(expected_guesses)
+        mock_benchmarker.run_benchmark.assert_called_once_with(expected_guesses, collect_games=False)
 
-    @patch.object(cli, "create_simul_benchmarker")
+    @patch.object(factory, "create_simul_benchmarker")
     def test_cli_with_simul_benchmark(self, patch_create_simul_benchmarker: MagicMock) -> None:
         # Arrange
         run_args = [
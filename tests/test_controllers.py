@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from unittest.mock import patch
 
+import pytest
+
 from doddle.controllers import HideController, SolveController
 from doddle.guess import MinimaxGuess
 from doddle.histogram import HistogramBuilder
@@ -109,3 +111,31 @@ class TestHideController:
 
         # Assert
         mock_get_user_guess.assert_called()
+
+    @patch.object(HideView, "update")
+    @patch.object(HideView, "get_user_guess")
+    def test_hide_never_reveals_a_guessed_solution(self, mock_get_user_guess, mock_update) -> None:
+
+        # Arrange
+        size = 5
+        guess = Word("SNAKE")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        view = HideView(size)
+
+        # Mocking
+        mock_get_user_guess.side_effect = RuntimeError
+
+        sut = HideController(dictionary, scorer, histogram_builder, view)
+
+        # Act
+        with pytest.raises(RuntimeError):
+            sut.hide(guess)
+
+        # Assert
+        (n, word, score, available_answers), _ = mock_update.call_args
+        assert n == 1
+        assert word == guess
+        assert not scorer.is_perfect_score(score)
+        assert guess not in available_answers
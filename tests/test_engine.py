@@ -11,7 +11,7 @@ from doddle.histogram import HistogramBuilder
 from doddle.scoring import Scorer
 from doddle.simul_solver import MinimaxSimulSolver
 from doddle.solver import EntropySolver
-from doddle.views import RunReporter
+from doddle.views import NullRunReporter, RunReporter
 from doddle.words import Word
 
 from .fake_dictionary import load_test_dictionary
@@ -42,6 +42,70 @@ class TestEngine:
         # Assert
         assert game.is_solved
 
+    @pytest.mark.parametrize("reporter_type, expected_calls", [(RunReporter, 2), (NullRunReporter, 0)])
+    def test_engine_only_calls_reporters_that_display(self, reporter_type, expected_calls) -> None:
+        # Arrange
+        size = 5
+        soln = Word("FUNKY")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = EntropySolver(histogram_builder)
+        sut = Engine(dictionary, scorer, histogram_builder, solver, reporter_type())
+
+        # Act
+        with patch.object(reporter_type, "display") as patch_display:
+            sut.run(soln, [Word("MULCH"), soln])
+
+        # Assert
+        assert patch_display.call_count == expected_calls
+
+    @patch.object(EntropySolver, "get_best_guess")
+    def test_engine_reuses_a_precomputed_opening(self, mock_get_best_guess) -> None:
+        # Arrange
+        size = 5
+        soln = Word("FUNKY")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = EntropySolver(histogram_builder)
+        reporter = RunReporter()
+        sut = Engine(dictionary, scorer, histogram_builder, solver, reporter)
+
+        mock_get_best_guess.side_effect = [EntropyGuess(soln, True, 5, True)]
+        opening = sut.opening([Word("MULCH")])
+        get_score_and_solns = histogram_builder.get_score_and_solns
+
+        # Act
+        with patch.object(HistogramBuilder, "get_score_and_solns") as patch_get_score_and_solns:
+            patch_get_score_and_solns.side_effect = get_score_and_solns
+            game = sut.run(soln, [Word("MULCH")], opening=opening)
+
+        # Assert
+        assert game.is_solved
+        assert game.scoreboard.rows[0].guess == Word("MULCH")
+        assert patch_get_score_and_solns.call_count == len(game.scoreboard.rows) - 1
+
+    @patch.object(EntropySolver, "get_best_guess")
+    def test_engine_counts_rounds(self, mock_get_best_guess) -> None:
+        # Arrange
+        size = 5
+        soln = Word("FUNKY")
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = EntropySolver(histogram_builder)
+        reporter = RunReporter()
+        sut = Engine(dictionary, scorer, histogram_builder, solver, reporter)
+
+        mock_get_best_guess.side_effect = [EntropyGuess(soln, True, 5, True)]
+
+        # Act
+        rounds = sut.run_rounds(soln, [Word("MULCH"), Word("STOLE")])
+
+        # Assert
+        assert rounds == 3
+
     @patch.object(EntropySolver, "get_best_guess")
     def test_engine_raises_error_if_non_convergent(self, mock_get_best_guess) -> None:
         # Arrange
@@ -94,6 +158,67 @@ class TestSimulEngine:
         # Assert
         assert game.is_solved
 
+    @patch.object(MinimaxSimulSolver, "get_best_guess")
+    def test_engine_buckets_shared_solutions_once(self, mock_get_best_guess) -> None:
+        # Arrange
+        size = 5
+        solns = [
+            Word("STICK"),
+            Word("SNAKE"),
+            Word("FLAME"),
+            Word("TOWER"),
+        ]
+
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = MinimaxSimulSolver(histogram_builder)
+        reporter = RunReporter()
+        sut = SimulEngine(dictionary, scorer, histogram_builder, solver, reporter)
+        get_solns_for_scores = histogram_builder.get_solns_for_scores
+        expected_scores = {scorer.score_word(soln, Word("MULCH")) for soln in solns}
+
+        mock_get_best_guess.side_effect = [MinimaxGuess(soln, False, 5, 5) for soln in solns]
+
+        # Act
+        with patch.object(HistogramBuilder, "get_solns_for_scores") as patch_get_solns_for_scores:
+            patch_get_solns_for_scores.side_effect = get_solns_for_scores
+            game = sut.run(solns, [Word("MULCH")])
+
+        # Assert
+        assert game.is_solved
+        first_call, *_ = patch_get_solns_for_scores.call_args_list
+        solns_bucketed = [call.args[0] for call in patch_get_solns_for_scores.call_args_list]
+        assert sum(solns is dictionary.common_words for solns in solns_bucketed) == 1
+        assert set(first_call.args[2]) == expected_scores
+
+    @patch.object(MinimaxSimulSolver, "get_best_guess")
+    def test_engine_reuses_a_precomputed_opening(self, mock_get_best_guess) -> None:
+        # Arrange
+        size = 5
+        solns = [Word("STICK"), Word("SNAKE")]
+
+        dictionary = load_test_dictionary(size)
+        scorer = Scorer(size)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, dictionary.common_words)
+        solver = MinimaxSimulSolver(histogram_builder)
+        reporter = RunReporter()
+        sut = SimulEngine(dictionary, scorer, histogram_builder, solver, reporter)
+
+        mock_get_best_guess.side_effect = [MinimaxGuess(soln, False, 5, 5) for soln in solns]
+        opening = sut.opening([Word("MULCH")])
+        get_solns_by_score = histogram_builder.get_solns_by_score
+
+        # Act
+        with patch.object(HistogramBuilder, "get_solns_by_score") as patch_get_solns_by_score:
+            patch_get_solns_by_score.side_effect = get_solns_by_score
+            game = sut.run(solns, [Word("MULCH")], opening=opening)
+
+        # Assert
+        assert game.is_solved
+        solns_bucketed = [call.args[0] for call in patch_get_solns_by_score.call_args_list]
+        assert not any(solns is dictionary.common_words for solns in solns_bucketed)
+
     @patch.object(MinimaxSimulSolver, "get_best_guess")
     def test_engine_raises_error_if_non_convergent(self, mock_get_best_guess) -> None:
         # Arrange
@@ -15,6 +15,7 @@ from doddle.factory import (
     create_simul_engine,
 )
 from doddle.solver import DeepEntropySolver, DeepMinimaxSolver, EntropySolver, MinimaxSolver
+from doddle.words import Word
 from tests.fake_dictionary import load_test_dictionary
 
 
@@ -84,6 +85,25 @@ class TestFactory:
         assert isinstance(solver1e, EntropySolver)
         assert isinstance(solver2e, DeepEntropySolver)
 
+    @patch.object(factory, "load_dictionary")
+    def test_create_models_shares_the_histogram_builder(self, patch_load_dictionary: MagicMock) -> None:
+        # Arrange
+        patch_load_dictionary.return_value = load_test_dictionary()
+
+        # Act
+        _, _, builder, solver, _ = create_models(5, depth=2, extras=[Word("DODDL")])
+        _, _, same_builder, _, _ = create_models(
+            5, solver_type=SolverType.ENTROPY, extras=(Word("DODDL"),)
+        )
+        _, _, other_builder, _, _ = create_models(5, depth=2)
+        _, _, _, other_solver, _ = create_models(5, depth=2, extras=[Word("DODDL")])
+
+        # Assert
+        assert same_builder is builder
+        assert other_builder is not builder
+        assert other_solver is not solver
+        assert patch_load_dictionary.call_count == 2
+
     @patch.object(factory, "load_dictionary")
     def test_create_models_with_unrecognised_enum_raises(self, patch_load_dictionary: MagicMock) -> None:
         # Arrange
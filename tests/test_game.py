@@ -46,6 +46,20 @@ class TestGame:
         assert row.n == 1
         assert sut.is_solved
 
+    def test_game_update_with_imperfect_score(self) -> None:
+        # Arrange
+        soln = Word("STICK")
+        dictionary = load_test_dictionary()
+
+        sut = Game(dictionary.common_words, soln, [])
+
+        # Act
+        row = sut.update(1, Word("STACK"), 233, WordSeries(["STICK", "STOCK"]))
+
+        # Assert
+        assert row.score == "22122"
+        assert not sut.is_solved
+
 
 class TestSimultaneousGame:
     def test_game_rounds(self) -> None:
@@ -61,3 +75,21 @@ class TestSimultaneousGame:
 
         # Assert
         assert actual == expected
+
+    def test_game_is_solved_once_every_game_is_solved(self) -> None:
+        # Arrange
+        solns = [Word("STICK"), Word("TOXIC")]
+        dictionary = load_test_dictionary()
+
+        sut = SimultaneousGame(dictionary.common_words, solns, [])
+        stick, toxic = sut.games
+
+        # Act
+        sut.update(1, stick, Word("STICK"), 242, WordSeries(["STICK"]))
+        sut.update(1, toxic, Word("STICK"), 37, WordSeries(["TOXIC"]))
+        is_solved_after_one = sut.is_solved
+        sut.update(2, toxic, Word("TOXIC"), 242, WordSeries(["TOXIC"]))
+
+        # Assert
+        assert not is_solved_after_one
+        assert sut.is_solved
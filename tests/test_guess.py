@@ -1,3 +1,5 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from doddle.guess import EntropyGuess, MinimaxGuess, MinimaxSimulGuess
@@ -117,6 +119,16 @@ class TestMinimaxGuess:
         # Assert
         assert combined_guess == expected
 
+    def test_minimax_guess_is_an_immutable_value(self) -> None:
+        # Arrange
+        guess1 = MinimaxGuess(Word("SNAKE"), True, 5, 20)
+        guess2 = MinimaxGuess(Word("SNAKE"), True, 5, 20)
+
+        # Act + Assert
+        assert hash(guess1) == hash(guess2)
+        with pytest.raises(FrozenInstanceError):
+            guess1.number_of_buckets = 6  # type: ignore
+
 
 class TestEntropyGuess:
     def test_entropy_guess_where_expected_shannon_entropy_differs(self) -> None:
@@ -165,6 +177,32 @@ class TestEntropyGuess:
         assert not is_better
         assert is_worse
 
+    def test_entropy_guess_where_entropy_differs_by_rounding_error(self) -> None:
+        # Arrange
+        word1 = Word("SNAKE")
+        word2 = Word("SHARK")
+        guess1 = EntropyGuess(word1, True, 0.1 + 0.2, False)
+        guess2 = EntropyGuess(word2, False, 0.3, False)
+
+        # Act
+        is_better = guess1 < guess2
+
+        # Assert
+        assert is_better
+
+    def test_entropy_guess_with_infinite_entropy_is_best(self) -> None:
+        # Arrange
+        word1 = Word("SNAKE")
+        word2 = Word("SHARK")
+        guess1 = EntropyGuess(word1, False, float("inf"), True)
+        guess2 = EntropyGuess(word2, True, 100.0, False)
+
+        # Act
+        is_better = guess1 < guess2
+
+        # Assert
+        assert is_better
+
     def test_entropy_add_entropy_from_second_guess(self) -> None:
         # Arrange
         word = Word("SNAKE")
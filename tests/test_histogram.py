@@ -1,6 +1,8 @@
+import pickle
 from unittest.mock import MagicMock, patch
 
 import numpy as np
+import pytest
 
 from doddle.guess import MinimaxGuess
 from doddle.histogram import HistogramBuilder, ScoreMatrix, _populate_histogram
@@ -45,6 +47,40 @@ class TestHistogramBuilder:
             for soln in bucketed_solns:
                 assert Word(soln) in actual_bucketed_solns
 
+    def test_gets_score_and_solns(self) -> None:
+        # Arrange
+        guess = Word("THURL")
+        soln = Word("SHARE")
+        words = ["SHADE", "SHALE", "SHARE", "SHARK", "SLATE", "SNAKE"]
+        potential_solns = WordSeries(words)
+        all_words = WordSeries(words + [guess.value])
+        histogram_builder = HistogramBuilder(Scorer(), all_words, potential_solns)
+
+        # Act
+        score, solns = histogram_builder.get_score_and_solns(potential_solns, guess, soln)
+
+        # Assert
+        assert score == from_ternary("02020")
+        assert list(solns) == [Word("SHARE"), Word("SHARK")]
+
+    def test_gets_solns_for_scores(self) -> None:
+        # Arrange
+        guess = Word("THURL")
+        words = ["SHADE", "SHALE", "SHARE", "SHARK", "SLATE", "SNAKE"]
+        potential_solns = WordSeries(words)
+        all_words = WordSeries(words + [guess.value])
+        histogram_builder = HistogramBuilder(Scorer(), all_words, potential_solns)
+        scores = [from_ternary("02020"), from_ternary("00000"), from_ternary("02020")]
+
+        # Act
+        solns_by_score = histogram_builder.get_solns_for_scores(potential_solns, guess, scores)
+
+        # Assert
+        assert {score: list(solns) for score, solns in solns_by_score.items()} == {
+            from_ternary("02020"): [Word("SHARE"), Word("SHARK")],
+            from_ternary("00000"): [Word("SNAKE")],
+        }
+
     def test_guess_stream(self) -> None:
         # Arrange
         guess = Word("THURL")
@@ -79,6 +115,21 @@ class TestHistogramBuilder:
         for g in guesses:
             assert g.is_potential_soln ^ (g.word == guess)
 
+    def test_summarise(self) -> None:
+        # Arrange
+        all_words, potential_solns = load_test_dictionary().words
+        histogram_builder = HistogramBuilder(Scorer(), all_words, potential_solns)
+        solns = potential_solns[::4]
+        expected = list(histogram_builder.stream(all_words, solns, MinimaxGuess.from_histogram))
+
+        # Act
+        largest, num_buckets, is_potential_soln = histogram_builder.summarise(all_words, solns)
+
+        # Assert
+        assert largest.tolist() == [guess.size_of_largest_bucket for guess in expected]
+        assert num_buckets.tolist() == [guess.number_of_buckets for guess in expected]
+        assert is_potential_soln.tolist() == [guess.is_potential_soln for guess in expected]
+
     def test_populate_histogram(self) -> None:
         # Arrange
         matrix = np.array(
@@ -146,3 +197,51 @@ class TestScoreMatrix:
 
         # Assert
         patch_precompute.assert_not_called()
+
+    def test_scores_are_only_read_once_computed(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        sut = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=True)
+        guess = Word("SNAKE")
+        solns = potential_solns[:3]
+
+        # Act
+        lazy_scores = sut.scores(guess, solns)
+        sut.precompute(solns)
+        scores = sut.scores(guess, solns)
+
+        # Assert
+        assert lazy_scores is None
+        assert scores is not None
+        assert scores.tolist() == [scorer.score_word(soln, guess) for soln in solns]
+
+    def test_pickled_matrix_shares_storage(self) -> None:
+        # Arrange
+        scorer = Scorer()
+        all_words, potential_solns = load_test_dictionary().words
+        sut = ScoreMatrix(scorer, all_words, potential_solns, lazy_eval=False)
+
+        # Act
+        payload = pickle.dumps(sut)
+        unpickled = pickle.loads(payload)
+        sut._storage[0, 0] = 7
+
+        # Assert
+        assert len(payload) < sut._storage.nbytes
+        assert unpickled.shared_memory.name == sut.shared_memory.name
+        assert unpickled._storage[0, 0] == 7
+
+    @pytest.mark.parametrize(
+        "size, expected", [(4, np.int8), (5, np.int16), (9, np.int16), (10, np.int32)]
+    )
+    def test_storage_is_the_narrowest_type_for_all_scores(self, size: int, expected: type) -> None:
+        # Arrange
+        all_words = WordSeries(["A" * size])
+
+        # Act
+        sut = ScoreMatrix(Scorer(size), all_words, all_words)
+
+        # Assert
+        assert sut._storage.dtype == expected
+        assert sut._storage[0, 0] == -1
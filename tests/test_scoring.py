@@ -63,6 +63,45 @@ class TestScorer:
         assert score == score_slow
         assert score == non_jit_score
 
+    def test_score_words(self) -> None:
+        # Arrange
+        sut = Scorer()
+        solns = [Word("SPEAR"), Word("PERKY"), Word("AGATE"), Word("GAMMA")]
+        guess = Word("MAGIC")
+
+        # Act
+        scores = sut.score_words(solns, guess)
+        no_scores = sut.score_words([], guess)
+
+        # Assert
+        assert scores.tolist() == [sut.score_word(soln, guess) for soln in solns]
+        assert len(no_scores) == 0
+
+    def test_score_all(self) -> None:
+        # Arrange
+        sut = Scorer()
+        solns = [Word("SPEAR"), Word("PERKY"), Word("AGATE"), Word("GAMMA"), Word("EERIE")]
+        guesses = [Word("MAGIC"), Word("GEESE"), Word("ALLAY")]
+
+        # Act
+        scores = sut.score_all(guesses, solns)
+        no_scores = sut.score_all(guesses, [])
+
+        # Assert
+        assert scores.tolist() == [[sut.score_word(soln, guess) for soln in solns] for guess in guesses]
+        assert no_scores.shape == (3, 0)
+
+    @pytest.mark.parametrize("size", [5, 12])
+    def test_to_ternary(self, size: int) -> None:
+        # Arrange
+        score = 183
+
+        # Act
+        ternary = to_ternary(score, size)
+
+        # Assert
+        assert ternary == "20210".zfill(size)
+
     def test_is_perfect_score(self) -> None:
         # Arrange
         sut = Scorer()
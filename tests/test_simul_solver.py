@@ -1,3 +1,5 @@
+import pytest
+
 from doddle.game import SimultaneousGame
 from doddle.histogram import HistogramBuilder
 from doddle.scoring import Scorer
@@ -30,6 +32,29 @@ class TestMinimaxSimulSolver:
         # Assert
         assert simul_guess.word == Word("LATER")
 
+    def test_simul_solver_get_best_guess_matches_the_guess_streams(self) -> None:
+        # Arrange
+        solns = [Word("STICK"), Word("SNAKE"), Word("FLAME")]
+
+        dictionary = load_test_dictionary()
+        common_words = dictionary.common_words
+        scorer = Scorer(dictionary.word_length)
+        histogram_builder = HistogramBuilder(scorer, dictionary.all_words, common_words)
+        sut = MinimaxSimulSolver(histogram_builder)
+
+        games = SimultaneousGame(common_words, solns, [])
+        for i, game in enumerate(games):
+            game.potential_solns = common_words[i::3]
+
+        # Act
+        simul_guess = sut.get_best_guess(dictionary.all_words, games)
+
+        # Assert
+        expected = min(sut.all_guesses(dictionary.all_words, games))
+        assert simul_guess.word == expected.word
+        assert simul_guess.pct_left == pytest.approx(expected.pct_left)
+        assert simul_guess.num_buckets == expected.num_buckets
+
     def test_simul_solver_seeds(self) -> None:
         # Arrange
         dictionary = load_test_dictionary()
@@ -3,6 +3,8 @@ from doddle.scoring import Scorer
 from doddle.solver import DeepEntropySolver, DeepMinimaxSolver, EntropySolver, MinimaxSolver
 from doddle.words import Word, WordSeries
 
+from .fake_dictionary import load_test_dictionary
+
 
 class TestMinimaxSolver:
     def test_get_best_guess(self) -> None:
@@ -25,6 +27,34 @@ class TestMinimaxSolver:
         # Assert
         assert best_guess.word == Word("TRASH")
 
+    def test_get_best_guess_matches_the_guess_stream(self) -> None:
+        # Arrange
+        dictionary = load_test_dictionary()
+        all_words, common_words = dictionary.words
+        potential_solns = common_words[::3]
+        histogram_builder = HistogramBuilder(Scorer(), all_words, common_words)
+        sut = MinimaxSolver(histogram_builder)
+
+        # Act
+        best_guess = sut.get_best_guess(all_words, potential_solns)
+
+        # Assert
+        assert best_guess == min(sut.all_guesses(all_words, potential_solns))
+
+    def test_best_guesses_match_the_guess_stream(self) -> None:
+        # Arrange
+        dictionary = load_test_dictionary()
+        all_words, common_words = dictionary.words
+        potential_solns = common_words[::3]
+        histogram_builder = HistogramBuilder(Scorer(), all_words, common_words)
+        sut = MinimaxSolver(histogram_builder)
+
+        # Act
+        best_guesses = sut._best_guesses(all_words, potential_solns, 5)
+
+        # Assert
+        assert best_guesses == sorted(sut.all_guesses(all_words, potential_solns))[:5]
+
 
 class TestDeepMinimaxSolver:
     def test_get_best_guess(self) -> None:
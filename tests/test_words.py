@@ -214,3 +214,18 @@ class TestDictionary:
         # Assert
         assert len(all_words) == 15787
         assert len(common_words) == 4563
+
+    def test_load_dictionary_shares_words(self) -> None:
+        # Arrange
+        size = 5
+        dictionary = load_dictionary(size, extras=[Word("DODDL")])
+
+        # Act
+        all_words, common_words = dictionary.words
+
+        # Assert
+        assert list(common_words.index) == list(range(len(common_words)))
+        assert list(common_words) == sorted(common_words)
+        assert Word("DODDL") in common_words
+        for word in common_words:
+            assert all_words.iloc[all_words.find_index(word)] is word